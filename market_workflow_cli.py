@@ -59,15 +59,9 @@ import os
 from datetime import datetime
 import logging
 from workflows.market.market_data import MarketDataFetcher
-from workflows.market.market_report_generator import (
-    generate_market_report,
-    generate_gdp_chart,
-    generate_inflation_chart,
-    generate_unemployment_chart,
-    generate_bond_chart
-)
+from workflows.market.market_report_generator import INDEX_TICKERS, generate_market_report
 from workflows.metadata_generator import generate_metadata, save_metadata
-from workflows.market.market_chart_generator import generate_market_index_chart, generate_single_bond_chart, generate_style_box_heatmap
+from workflows.market.market_chart_generator import generate_all_charts
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -119,45 +113,30 @@ def create_market_report(args) -> str:
     TWO_YEAR_KEY = '2-Year Treasury'
     # This ensures consistency for value cards, chart generation, and template usage.
     
-    # Fetch additional data if your fetcher supports it
-    if hasattr(data_fetcher, "fetch_interest_rates"):
-        data['interest_rates'] = data_fetcher.fetch_interest_rates()
-    if hasattr(data_fetcher, "fetch_market_indices"):
-        data['indices'] = data_fetcher.fetch_market_indices()
-    if hasattr(data_fetcher, "fetch_economic_indicators"):
-        data['economic_indicators'] = data_fetcher.fetch_economic_indicators()
-
-    # --- Generate market index charts ---
-    market_index_charts = {}
-    index_tickers = {
-        'S&P 500': 'SPY',
-        'Dow Jones': 'DIA',
-        'Nasdaq-100': 'QQQ',
-        'S&P 400 MidCap': 'MDY',
-        'Russell 2000': 'IWM',
-        'S&P 500 Growth': 'IVW',
-        'S&P 500 Value': 'IVE',
-        'Dollar Index': 'UUP',
-        'Oil (WTI)': 'USO',
-        'VIX': 'VIXY',
-    }
+    # Fetch all independent data sources concurrently
+    fetched = data_fetcher.fetch_all()
+    data['interest_rates'] = fetched['interest_rates']
+    data['indices'] = fetched['indices']
+    data['economic_indicators'] = fetched['economic_indicators']
+    data['todays_events'] = fetched['todays_events']
+
+    # --- Fetch market index histories (charts are generated with the rest below) ---
     indices = data.get('indices', {})
+    wanted_tickers = {}
     for group, group_indices in indices.items():
         for idx in group_indices:
             name = idx.get('name')
-            ticker = index_tickers.get(name)
+            ticker = INDEX_TICKERS.get(name)
             if ticker:
-                hist_data = data_fetcher.fetch_index_history(ticker, periods=60)
-                chart_path = generate_market_index_chart(hist_data, report_dir, name)
-                market_index_charts[name] = chart_path
-    data['market_index_charts'] = market_index_charts
+                wanted_tickers[name] = ticker
+    index_histories = data_fetcher.fetch_index_histories(wanted_tickers, periods=60)
     
     try:
-        # Fetch historical data
-        gdp_growth_data = data_fetcher.get_gdp_data()
-        inflation_data = data_fetcher.get_inflation_data()
-        unemployment_data = data_fetcher.get_unemployment_data()
-        bond_10y_data = data_fetcher.get_bond_data()
+        # Historical data was fetched up front by fetch_all
+        gdp_growth_data = fetched['gdp']
+        inflation_data = fetched['inflation']
+        unemployment_data = fetched['unemployment']
+        bond_10y_data = fetched['bond']
         bond_2y_data = bond_10y_data.get('values_2y', []) if bond_10y_data else []
         
         # Combine bond data if 2Y is available
@@ -171,35 +150,41 @@ def create_market_report(args) -> str:
         else:
             bond_data = bond_10y_data
         
-        # Only generate charts if we have data
-        if gdp_growth_data and gdp_growth_data.get('values'):
-            data['gdp_chart_path'] = generate_gdp_chart(gdp_growth_data, report_dir)
-        if inflation_data and inflation_data.get('values'):
-            data['inflation_chart_path'] = generate_inflation_chart(inflation_data, report_dir)
-        if unemployment_data and unemployment_data.get('values'):
-            data['unemployment_chart_path'] = generate_unemployment_chart(unemployment_data, report_dir)
-        if bond_data and bond_data.get('values'):
-            data['bond_chart_path'] = generate_bond_chart(bond_data, report_dir)
-        # Generate separate charts for 10Y and 2Y Treasury if possible
+        # Build the chart inputs, only for series we have data for
+        single_bonds = {}
         if bond_10y_data and bond_10y_data.get('labels') and bond_10y_data.get('values'):
             ten_year_data = {
                 'labels': bond_10y_data['labels'],
                 'values': bond_10y_data['values'],
             }
-            data['ten_year_chart_path'] = generate_single_bond_chart(ten_year_data, report_dir, 'ten_year_chart.html', TEN_YEAR_KEY + ' Yield')
+            single_bonds['ten_year_chart.html'] = (ten_year_data, TEN_YEAR_KEY + ' Yield')
         if bond_10y_data and bond_10y_data.get('labels') and bond_10y_data.get('values_2y'):
             two_year_data = {
                 'labels': bond_10y_data['labels'],
                 'values': bond_10y_data['values_2y'],
             }
-            data['two_year_chart_path'] = generate_single_bond_chart(two_year_data, report_dir, 'two_year_chart.html', TWO_YEAR_KEY + ' Yield')
-        
-        # --- Generate style box heatmap for economic trends ---
-        style_box_data = data_fetcher.fetch_style_box_etf_data()
-        style_box_heatmap_path = None
-        if style_box_data and style_box_data.get('z'):
-            style_box_heatmap_path = generate_style_box_heatmap(style_box_data, report_dir)
-        data['style_box_heatmap_path'] = style_box_heatmap_path
+            single_bonds['two_year_chart.html'] = (two_year_data, TWO_YEAR_KEY + ' Yield')
+        style_box_data = fetched['style_box']
+
+        # Generate every chart in parallel; none of them depend on each other
+        chart_paths = generate_all_charts({
+            'gdp': gdp_growth_data if gdp_growth_data and gdp_growth_data.get('values') else None,
+            'inflation': inflation_data if inflation_data and inflation_data.get('values') else None,
+            'unemployment': unemployment_data if unemployment_data and unemployment_data.get('values') else None,
+            'bond': bond_data if bond_data and bond_data.get('values') else None,
+            'style_box': style_box_data if style_box_data and style_box_data.get('z') else None,
+            'single_bonds': single_bonds,
+            'indices': index_histories,
+        }, report_dir)
+        data['market_index_charts'] = {name: chart_paths.get(name) for name in index_histories}
+        for kind in ('gdp', 'inflation', 'unemployment', 'bond'):
+            if kind in chart_paths:
+                data[f'{kind}_chart_path'] = chart_paths[kind]
+        if 'ten_year_chart.html' in chart_paths:
+            data['ten_year_chart_path'] = chart_paths['ten_year_chart.html']
+        if 'two_year_chart.html' in chart_paths:
+            data['two_year_chart_path'] = chart_paths['two_year_chart.html']
+        data['style_box_heatmap_path'] = chart_paths.get('style_box')
         
         # Store historical data
         data.update({
@@ -0,0 +1,43 @@
+import json
+import re
+import shutil
+
+import pytest
+
+from workflows.market import market_chart_generator as mcg
+
+_NEW_PLOT_RE = re.compile(r'Plotly\.newPlot\("([^"]+)", (.*)\);\n', re.DOTALL)
+
+_GDP = {'labels': ['Q1 2024', 'Q2 2024', 'Q3 2024'], 'values': [1.4, 3.0, -0.5]}
+
+
+def _new_plot_args(path):
+    with open(path, encoding='utf-8') as f:
+        match = _NEW_PLOT_RE.search(f.read())
+    assert match, 'no Plotly.newPlot call found'
+    return match.group(1), json.loads(match.group(2))
+
+
+@pytest.mark.parametrize('embed_mode', ['standalone', 'fragment'])
+def test_config_reaches_plotly(tmp_path, embed_mode):
+    relpath = mcg.generate_gdp_chart(_GDP, str(tmp_path), embed_mode=embed_mode)
+    assert relpath
+    _, figure = _new_plot_args(tmp_path / relpath)
+    # Plotly.newPlot reads data, layout and config from the single figure object it is given
+    assert figure['config'] == mcg._WRITE_CONFIG
+    assert figure['data'][0]['type'] == 'bar'
+    assert figure['layout']['title']['text'] == 'Real GDP Growth'
+
+
+def test_yield_chart_keeps_its_own_config(tmp_path):
+    data = {'labels': ['2024-01', '2024-02'], 'values': [4.1, 4.3]}
+    relpath = mcg.generate_single_bond_chart(data, str(tmp_path), 'ten_year_chart.html', '10Y Treasury Yield')
+    _, figure = _new_plot_args(tmp_path / relpath)
+    assert figure['config'] == mcg._CHART_SPECS['yield']['config']
+
+
+def test_charts_dir_recreated_after_deletion(tmp_path):
+    assert mcg.generate_gdp_chart(_GDP, str(tmp_path))
+    shutil.rmtree(tmp_path / 'charts')
+    relpath = mcg.generate_gdp_chart({**_GDP, 'values': [1.4, 3.0, 0.5]}, str(tmp_path))
+    assert (tmp_path / relpath).is_file()
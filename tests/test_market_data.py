@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+os.environ.setdefault('POLYGON_API_KEY', 'test')
+
+from workflows.market import market_data as md
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    # Keep the fetcher's disk cache out of the repo and start every test with an empty memo
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(md, '_RESPONSE_CACHE', {})
+    return md.MarketDataFetcher()
+
+
+def test_memo_key_ignores_call_spelling(fetcher, monkeypatch):
+    calls = []
+
+    def fake_fred_obs(self, series_id, limit, frequency=None):
+        calls.append((series_id, limit, frequency))
+        return {'observations': [{'date': '2025-01-01', 'value': '1.0'}]}
+
+    memoized = md._ttl_cached(60, keep=lambda data: bool(data.get('observations')))(fake_fred_obs)
+    monkeypatch.setattr(md.MarketDataFetcher, '_fred_obs', memoized)
+    fetcher._fred_obs('UNRATE', 5)
+    fetcher._fred_obs('UNRATE', 5, None)
+    fetcher._fred_obs('UNRATE', limit=5, frequency=None)
+    fetcher._fred_obs(series_id='UNRATE', limit=5)
+    assert calls == [('UNRATE', 5, None)]
+
+
+class _FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class _CountingSession:
+    """Stands in for the pooled HTTP session, answering every FRED request with 24 monthly observations."""
+
+    def __init__(self):
+        self.series = []
+
+    def get(self, url, params=None, timeout=None):
+        self.series.append(params['series_id'])
+        observations = [{'date': f'{2025 - m // 12}-{12 - m % 12:02d}-01', 'value': str(300.0 - m)} for m in range(24)]
+        return _FakeResponse(md.orjson.dumps({'observations': observations}))
+
+
+@pytest.mark.parametrize('concurrent', [False, True])
+def test_indicators_and_inflation_chart_share_one_cpi_request(fetcher, monkeypatch, concurrent):
+    session = _CountingSession()
+    fetcher._http = session
+    fetcher.fred_api_key = 'test'
+    # Only the in-process memo may dedupe here, not the disk cache
+    monkeypatch.setattr(md.MarketDataFetcher, '_load_from_cache', lambda self, key, max_age_hours=24: None)
+    if concurrent:
+        with md.ThreadPoolExecutor(max_workers=2) as executor:
+            indicators = executor.submit(fetcher.fetch_economic_indicators)
+            inflation = executor.submit(fetcher.get_inflation_data)
+            indicators, inflation = indicators.result(), inflation.result()
+    else:
+        indicators = fetcher.fetch_economic_indicators()
+        inflation = fetcher.get_inflation_data()
+    assert session.series.count('CPIAUCSL') == 1
+    assert indicators['CPI']['value'] != 'N/A'
+    assert len(inflation['values']) == 8
+
+
+class _CsvSession:
+    def __init__(self, text):
+        self.text = text
+
+    def get(self, url, params=None, timeout=None):
+        return self
+
+    def raise_for_status(self):
+        pass
+
+
+def test_bond_series_stay_aligned_with_labels(fetcher):
+    fetcher._http = _CsvSession(
+        'observation_date,DGS10,DGS2\n'
+        '2025-01-02,4.0,4.2\n'
+        '2025-01-03,4.2,4.4\n'
+        '2025-02-03,,4.1\n'   # no 10Y at all in February
+        '2025-03-03,4.5,4.0\n'
+        '2025-04-01,.,.\n'    # April so far is a single holiday row
+    )
+    data = fetcher.get_bond_data(periods=12)
+    assert data == {'labels': ['2025-03', '2025-01'], 'values': [4.5, 4.1], 'values_2y': [4.0, 4.3]}
@@ -23,6 +23,9 @@ TRADING_ECON_API_KEY = os.getenv('TRADING_ECON_API_KEY')
 if not TRADING_ECON_API_KEY:
     print("Warning: TRADING_ECON_API_KEY environment variable is not set. Economic calendar data will not be available.")
 
+# Optional shared cache; when set, fetchers also cache results in Redis
+REDIS_URL = os.getenv('REDIS_URL')
+
 # OpenAI API configuration
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 if not OPENAI_API_KEY:
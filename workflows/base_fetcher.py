@@ -1,13 +1,47 @@
 import os
-import json
 import logging
+import threading
+import time
 from datetime import datetime
 from functools import lru_cache
 from typing import Dict, Optional
+import orjson
 import pandas as pd
+from utils.config import REDIS_URL
 
 logger = logging.getLogger(__name__)
 
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Namespace for every key this project stores in a shared Redis; followed by the fetcher's cache_subdir
+_REDIS_KEY_PREFIX = 'backtesting:fetcher:'
+# Set after the first connection failure; the rest of the process then uses the disk cache only
+_redis_down = threading.Event()
+
+
+@lru_cache(maxsize=None)
+def _redis_client():
+    """Return a shared Redis client when REDIS_URL is set, else None."""
+    if not REDIS_URL:
+        return None
+    try:
+        import redis
+        return redis.Redis.from_url(REDIS_URL)
+    except Exception as e:
+        logger.warning(f"Redis cache unavailable, using disk cache only: {e}")
+        return None
+
+
+def _redis_failed(action: str, key: str, e: Exception) -> None:
+    """Log a Redis error; a connection failure disables Redis for the rest of the process, logged once."""
+    import redis
+    if isinstance(e, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)):
+        if not _redis_down.is_set():
+            _redis_down.set()
+            logger.warning("Redis unreachable, using disk cache only from now on: %s", e)
+    else:
+        logger.warning("Redis %s failed for %s: %s", action, key, e)
+
 class BaseFetcher:
     """Base class for data fetchers with common utilities"""
     
@@ -24,6 +58,8 @@ class BaseFetcher:
         os.makedirs(self.cache_dir, exist_ok=True)
         print(f"[DEBUG] Cache directory created: {os.path.exists(self.cache_dir)}")
         self.force_refresh = force_refresh
+        self._redis = _redis_client()
+        self._redis_prefix = f"{_REDIS_KEY_PREFIX}{cache_subdir}:"
     
     def _get_cache_path(self, key: str) -> str:
         """Get the cache file path for a given key"""
@@ -35,6 +71,16 @@ class BaseFetcher:
     
     def _load_from_cache(self, key: str, max_age_hours: int = 24) -> Optional[Dict]:
         """Load data from cache if it exists and is not expired"""
+        if self._redis is not None and not _redis_down.is_set():
+            try:
+                blob = self._redis.get(self._redis_prefix + key)
+                if blob:
+                    # Entries carry their save time, so a caller asking for fresher data than the writer's TTL misses
+                    entry = orjson.loads(blob)
+                    if time.time() - entry['saved_at'] <= max_age_hours * 3600:
+                        return entry['data']
+            except Exception as e:
+                _redis_failed('get', key, e)
         try:
             cache_path = self._get_cache_path(key)
             print(f"[DEBUG] Loading from cache: {cache_path}")
@@ -49,8 +95,8 @@ class BaseFetcher:
                 return None
                 
             print(f"[DEBUG] Loading cache file: {cache_path}")
-            with open(cache_path, 'r') as f:
-                return json.load(f)
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
                 
         except Exception as e:
             print(f"[ERROR] Error loading from cache: {str(e)}")
@@ -58,13 +104,20 @@ class BaseFetcher:
             print(f"[ERROR] Traceback: {traceback.format_exc()}")
             return None
     
-    def _save_to_cache(self, key: str, data: Dict) -> None:
-        """Save data to cache"""
+    def _save_to_cache(self, key: str, data: Dict, ttl_seconds: int = 86400) -> None:
+        """Save data to cache (and to Redis with ttl_seconds when configured)"""
+        if self._redis is not None and not _redis_down.is_set():
+            try:
+                entry = orjson.dumps({'saved_at': time.time(), 'data': data}, option=_ORJSON_OPTS)
+                self._redis.setex(self._redis_prefix + key, ttl_seconds, entry)
+            except Exception as e:
+                _redis_failed('set', key, e)
         try:
             cache_path = self._get_cache_path(key)
             print(f"[DEBUG] Saving to cache: {cache_path}")
-            with open(cache_path, 'w') as f:
-                json.dump(data, f)
+            payload = orjson.dumps(data, option=_ORJSON_OPTS)
+            with open(cache_path, 'wb') as f:
+                f.write(payload)
             print(f"[DEBUG] Cache file saved: {os.path.exists(cache_path)}")
         except Exception as e:
             print(f"[ERROR] Error saving to cache: {str(e)}")
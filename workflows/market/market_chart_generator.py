@@ -3,452 +3,607 @@ Market chart generator for economic indicators and market data.
 """
 
 import os
+import hashlib
 import json
+import orjson
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 import logging
 import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Remove the debug print
-# print("[DEBUG] market_chart_generator.py loaded, go is:", 'go' in globals())
+# Market theme palette, shared by every chart
+_GREEN = 'rgb(34, 197, 94)'
+_RED = 'rgb(239, 68, 68)'
+_YELLOW = 'rgb(234, 179, 8)'
+_BLUE = 'rgb(59, 130, 246)'
+_SLATE = 'rgb(148, 163, 184)'
+_BG = 'rgb(13, 18, 30)'
 
-def generate_gdp_chart(data: Dict, output_dir: str) -> Optional[str]:
-    """Generate GDP chart using Plotly."""
+# Plotly config shared by the standalone chart files
+_WRITE_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+# plotly.js build matching the installed plotly package, for pages that load the library once themselves
+PLOTLYJS_CDN_URL = f'https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js'
+
+# How standalone chart pages load plotly.js: 'cdn', 'directory' (one shared plotly.min.js next to the charts)
+# or 'inline' (embed the full bundle in every file)
+PLOTLYJS_MODE = os.environ.get('PLOTLYJS_MODE', 'cdn')
+
+def _plotlyjs_mode(chart_path: str, mode: Optional[str] = None):
+    """Resolve the plotly.js mode for a chart file, writing the shared bundle once in 'directory' mode."""
+    mode = mode or PLOTLYJS_MODE
+    if mode == 'directory':
+        asset_path = os.path.join(os.path.dirname(chart_path), 'plotly.min.js')
+        if not os.path.exists(asset_path):
+            # Write then rename so parallel chart workers never see a partial bundle
+            tmp_path = f'{asset_path}.{os.getpid()}.tmp'
+            _write_file(tmp_path, _plotlyjs())
+            os.replace(tmp_path, asset_path)
+        return mode
+    return mode if mode == 'cdn' else True
+
+def _write_file(path: str, content) -> None:
+    """Write text (as UTF-8) or bytes to disk in one call through a 1 MiB buffered handle.
+
+    The parent directory is only created when the first open fails, so batch writes into a directory
+    the driver already made cost no extra syscalls.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
     try:
-        # Check if data is empty
-        if not data.get('labels') or not data.get('values'):
-            print("ERROR - GDP data is empty or missing labels/values")
-            return None
-        # Convert data for plotly
-        chart_data = []
-        labels = []
-        values = []
-        colors = []
-        
-        for i, (label, value) in enumerate(zip(data['labels'], data['values'])):
-            try:
-                if label and value is not None:
-                    quarter = int(label[1])
-                    year = int(label.split()[1])
-                    labels.append(f"Q{quarter} {year}")
-                    values.append(float(value))
-                    colors.append('rgb(34, 197, 94)' if float(value) >= 0 else 'rgb(239, 68, 68)')
-            except Exception as e:
-                print(f"Error processing GDP data point {i}: {e}")
-
-        # Create the bar chart
-        fig = go.Figure(data=[
-            go.Bar(
-                x=labels,
-                y=values,
-                marker_color=colors,
-                text=[f"{v:+.1f}%" for v in values],  # Show values with + or - sign
-                textposition='outside',  # Place text above bars
-                textfont={'size': 14, 'color': '#94a3b8'},  # Larger, visible text
-                hovertemplate="<b>%{x}</b><br>" +
-                            "GDP Growth: %{text}<br>" +
-                            "<extra></extra>"  # Remove secondary box
-            )
-        ])
-
-        # Update layout
-        fig.update_layout(
-            title={
-                'text': 'Real GDP Growth',
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top',
-                'font': {'color': 'rgb(148, 163, 184)', 'size': 28}
-            },
-            plot_bgcolor='rgb(13, 18, 30)',
-            paper_bgcolor='rgb(13, 18, 30)',
-            font={'color': 'rgb(148, 163, 184)', 'size': 14},
-            showlegend=False,
-            margin=dict(t=60, l=50, r=30, b=80),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title=None,
-                tickangle=45,
-                tickmode='array',
-                ticktext=labels,
-                tickvals=list(range(len(labels))),
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                zeroline=True,
-                zerolinecolor='rgba(148, 163, 184, 0.5)',
-                zerolinewidth=1,
-                ticksuffix='%',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title={'text': 'Growth Rate', 'font': {'size': 14, 'color': 'rgb(148, 163, 184)'}},
-                range=[min(values) - 1, max(values) + 1],
-                tickformat='.1f'
-            ),
-            autosize=True
-        )
+        f = open(path, 'wb', buffering=1 << 20)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(path, 'wb', buffering=1 << 20)
+    with f:
+        f.write(content)
 
-        # Add a horizontal line at y=0
-        fig.add_hline(
-            y=0,
-            line_color='rgba(148, 163, 184, 0.5)',
-            line_width=1
-        )
+def _charts_dir(output_dir: str) -> str:
+    """Path of <output_dir>/charts; ensure_charts_dir creates it."""
+    return os.path.join(output_dir, 'charts')
 
-        # Add healthy growth range (2-3%)
-        fig.add_hrect(
-            y0=2, y1=3,
-            fillcolor="rgba(59, 130, 246, 0.1)",  # Light blue for the target range
-            line_width=0
-        )
+def ensure_charts_dir(output_dir: str) -> str:
+    """Create <output_dir>/charts once per report batch and return its path."""
+    charts_dir = _charts_dir(output_dir)
+    os.makedirs(charts_dir, exist_ok=True)
+    return charts_dir
 
-        # Add optimal range (3.5-4.5%)
-        fig.add_hrect(
-            y0=3.5, y1=4.5,
-            fillcolor="rgba(74, 222, 128, 0.1)",
-            line_width=0
-        )
+def _chart_relpath(chart_path: str) -> str:
+    """Path of a chart file relative to its output_dir; every chart lives directly under <output_dir>/charts."""
+    return os.path.join('charts', os.path.basename(chart_path))
 
-        # Save the chart
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
-        chart_path = os.path.join(charts_dir, 'gdp_chart.html')
-        
-        fig.write_html(
-            chart_path,
-            include_plotlyjs=True,
-            full_html=True,
-            config={
-                'displayModeBar': False,
-                'responsive': True
-            }
-        )
-        
-        return os.path.relpath(chart_path, output_dir)
-        
-    except Exception as e:
-        print(f"ERROR - Failed to generate GDP chart: {e}")
-        return None
+def _chart_file(output_dir: str, filename: str, embed_mode: str = 'standalone') -> str:
+    """Path of a chart file under <output_dir>/charts; fragments get a .frag.html suffix instead of .html."""
+    if embed_mode == 'fragment':
+        filename = os.path.splitext(filename)[0] + '.frag.html'
+    return os.path.join(_charts_dir(output_dir), filename)
 
-def generate_inflation_chart(data: Dict, output_dir: str) -> Optional[str]:
-    """Generate inflation chart as a bar chart using Plotly."""
+def _write_chart_html(fig, chart_path: str, config: Dict = _WRITE_CONFIG, include_plotlyjs: Optional[str] = None,
+                      fragment_id: Optional[str] = None) -> None:
+    """Render a figure to a standalone HTML page on disk, or to a bare div + script fragment when fragment_id is set."""
+    if fragment_id:
+        html = pio.to_html(fig, include_plotlyjs=False, full_html=False, config=config, div_id=fragment_id,
+                           validate=False)
+    else:
+        html = pio.to_html(fig, include_plotlyjs=_plotlyjs_mode(chart_path, include_plotlyjs), full_html=True,
+                           config=config, validate=False)
+    _write_file(chart_path, html)
+
+# Chart div plus the script that draws it. Plotly.newPlot takes the whole, already serialized figure object;
+# given an object it reads the config from that object and ignores any further arguments, so the config is
+# spliced into the figure JSON rather than passed separately
+_FRAGMENT_TEMPLATE = """<div id="{plot_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+<script type="text/javascript">
+    window.PLOTLYENV=window.PLOTLYENV || {{}};
+    if (document.getElementById("{plot_id}")) {{
+        Plotly.newPlot("{plot_id}", {fig_json});
+    }};
+</script>"""
+# Standalone page wrapping a fragment together with the plotly.js script tag
+_HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div>
+        <script type="text/javascript">window.PlotlyConfig = {{MathJaxConfig: 'local'}};</script>
+        {plotlyjs}
+        {fragment}
+    </div>
+</body>
+</html>"""
+_CONFIG_JSON = json.dumps(_WRITE_CONFIG)
+
+@lru_cache(maxsize=1)
+def _plotlyjs() -> str:
+    """Read the bundled plotly.js source once per process."""
+    return get_plotlyjs()
+
+def _write_chart_json_html(fig_json: str, chart_path: str, fragment: bool = False, plot_id: Optional[str] = None,
+                           config_json: str = _CONFIG_JSON) -> None:
+    """Write an already serialized figure as a standalone page, or as a bare fragment without plotly.js."""
+    fig_json = f'{fig_json[:-1]},"config":{config_json}}}'
+    html = _FRAGMENT_TEMPLATE.format(plot_id=plot_id or uuid.uuid4(), fig_json=fig_json)
+    if not fragment:
+        mode = _plotlyjs_mode(chart_path)
+        if mode == 'cdn':
+            script = f'<script charset="utf-8" src="{PLOTLYJS_CDN_URL}"></script>'
+        elif mode == 'directory':
+            script = '<script charset="utf-8" src="plotly.min.js"></script>'
+        else:
+            script = f'<script type="text/javascript">{_plotlyjs()}</script>'
+        html = _HTML_TEMPLATE.format(plotlyjs=script, fragment=html)
+    _write_file(chart_path, html)
+
+_GDP_LABEL_RE = re.compile(r'^Q(\d)\s+(\d{4})')
+
+def _build_gdp(data: Dict):
+    """Build the GDP bar trace, keeping only well-formed quarter labels."""
+    if not data.get('labels') or not data.get('values'):
+        raise ValueError("GDP data is empty or missing labels/values")
+    n = min(len(data['labels']), len(data['values']))
+    # Parse labels and values column-wise; malformed labels and missing values become NaN and are masked out
+    parts = pd.Series(data['labels'][:n], dtype=object).astype(str).str.extract(_GDP_LABEL_RE)
+    values_arr = pd.to_numeric(pd.Series(data['values'][:n], dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+    keep = parts.notna().all(axis=1).to_numpy() & np.isfinite(values_arr)
+    skipped = n - int(keep.sum())
+    if skipped:
+        logger.warning("Skipped %d GDP data point(s) with missing or malformed label/value", skipped)
+    # Keep the arrays as ndarrays so the trace and the x-axis ticks share them
+    labels_np = ('Q' + parts[0] + ' ' + parts[1]).to_numpy(dtype=object)[keep]
+    values_np = values_arr[keep]
+    colors_np = np.where(values_np >= 0, _GREEN, _RED)
+    ticks_np = np.arange(len(labels_np))
+    trace = {
+        'type': 'bar',
+        'x': labels_np,
+        'y': values_np,
+        'marker': {'color': colors_np},
+        'text': np.char.mod('%+.1f%%', values_np),  # Show values with + or - sign
+        'textposition': 'outside',
+        'textfont': {'size': 14, 'color': '#94a3b8'},
+        'hovertemplate': "<b>%{x}</b><br>GDP Growth: %{text}<br><extra></extra>",
+    }
+    xaxis = {'tickmode': 'array', 'ticktext': labels_np, 'tickvals': ticks_np}
+    return [trace], [values_np], [], xaxis
+
+def _build_inflation(data: Dict):
+    """Build the inflation bar trace."""
+    labels = data['labels']
+    values = np.asarray(data['values'], dtype=np.float64)
+    # Color coding: green for target (2-2.5%), yellow for below target, red for above target
+    colors = np.select([(values >= 2.0) & (values <= 2.5), values < 2.0],
+                       [_GREEN, _YELLOW], default=_RED)
+    trace = {
+        'type': 'bar',
+        'x': labels,
+        'y': values,
+        'marker': {'color': colors},
+        'text': np.char.mod('%.1f%%', values),
+        'textposition': 'outside',
+        'textfont': {'size': 14, 'color': '#94a3b8'},
+        'hovertemplate': "<b>%{x}</b><br>Inflation: %{y:.1f}%<extra></extra>",
+    }
+    return [trace], [values], [], None
+
+def _build_unemployment(data: Dict):
+    """Build the unemployment bar trace."""
+    labels = data['labels']
+    values = np.asarray(data['values'], dtype=np.float64)
+    # Color coding: green for <=4.0, yellow for <=4.4, red for >4.4
+    colors = np.select([values <= 4.0, values <= 4.4],
+                       [_GREEN, _YELLOW], default=_RED)
+    trace = {
+        'type': 'bar',
+        'x': labels,
+        'y': values,
+        'marker': {'color': colors},
+        'text': np.char.mod('%.1f%%', values),
+        'textposition': 'outside',
+        'textfont': {'size': 14, 'color': '#94a3b8'},
+        'hovertemplate': "<b>%{x}</b><br>Unemployment: %{y:.1f}%<extra></extra>",
+    }
+    return [trace], [values], [], None
+
+def _yield_trace(labels, values, name: str, color: str, hover_label: str) -> Dict:
+    """Build one line+marker trace for a Treasury yield series, drawn with WebGL."""
+    return {
+        'type': 'scattergl',
+        'x': labels,
+        'y': values,
+        'mode': 'lines+markers',
+        'name': name,
+        'line': {'color': color, 'width': 2},
+        'marker': {'size': 8, 'color': color},
+        'hovertemplate': f"<b>%{{x}}</b><br>{hover_label}: %{{y:.2f}}%<extra></extra>",
+    }
+
+def _build_bond(data: Dict):
+    """Build the 10Y/2Y yield traces and shade yield curve inversions, with robust length handling."""
+    labels = data['labels']
+    values_10y = data['values']
+    values_2y = data.get('values_2y')
+    # Ensure all lists are the same length
+    n = len(labels)
+    if values_2y:
+        n = min(n, len(values_10y), len(values_2y))
+        if not (len(labels) == len(values_10y) == len(values_2y)):
+            logger.debug("Mismatched lengths: labels=%d, 10Y=%d, 2Y=%d. Trimming to %d.",
+                         len(labels), len(values_10y), len(values_2y), n)
+        labels = labels[:n]
+        values_10y = values_10y[:n]
+        values_2y = values_2y[:n]
+    else:
+        n = min(n, len(values_10y))
+        if not (len(labels) == len(values_10y)):
+            logger.debug("Mismatched lengths: labels=%d, 10Y=%d. Trimming to %d.", len(labels), len(values_10y), n)
+        labels = labels[:n]
+        values_10y = values_10y[:n]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Chart labels: %s", labels)
+        logger.debug("10Y values: %s", values_10y)
+        logger.debug("2Y values: %s", values_2y)
+    # Convert each series once; the arrays feed the range, the inversion scan and the traces
+    arr_10y = np.asarray(values_10y, dtype=np.float64)
+    arr_2y = np.asarray(values_2y, dtype=np.float64) if values_2y else None
+    traces = [_yield_trace(labels, values_10y, '10Y Treasury', _BLUE, '10Y Yield')]
+    shapes = []
+    if arr_2y is not None:
+        traces.append(_yield_trace(labels, values_2y, '2Y Treasury', _RED, '2Y Yield'))
+        # Highlight contiguous inversion regions (2Y > 10Y): run starts/ends are where the padded mask flips
+        edges = np.diff(np.concatenate(([0], (arr_2y > arr_10y).view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1) - 1
+        for start, end in zip(starts, ends):
+            shapes.append({
+                'type': 'rect',
+                'xref': 'x', 'yref': 'y domain',
+                'x0': labels[start], 'x1': labels[end],
+                'y0': 0, 'y1': 1,
+                'fillcolor': 'rgba(239, 68, 68, 0.15)',
+                'line': {'width': 0},
+                'layer': 'below',
+            })
+    return traces, [arr_10y] if arr_2y is None else [arr_10y, arr_2y], shapes, None
+
+def _build_yield(data: Dict):
+    """Build the line trace for a single Treasury yield series named by data['title']."""
+    values = np.asarray(data['values'], dtype=np.float64)
+    trace = _yield_trace(data['labels'], data['values'], data['title'], _BLUE, data['title'])
+    return [trace], [values], [], None
+
+# Dark-theme styling shared by the indicator and yield charts, registered once as the 'market' plotly template
+_MARKET_LAYOUT = {
+    'title': {
+        'y': 0.95,
+        'x': 0.5,
+        'xanchor': 'center',
+        'yanchor': 'top',
+        'font': {'color': _SLATE, 'size': 28}
+    },
+    'plot_bgcolor': _BG,
+    'paper_bgcolor': _BG,
+    'font': {'color': _SLATE, 'size': 14, 'family': 'system-ui'},
+    'margin': {'t': 60, 'l': 50, 'r': 30, 'b': 80},
+    'xaxis': {
+        'showgrid': True,
+        'gridcolor': 'rgba(148, 163, 184, 0.1)',
+        'tickfont': {'size': 12, 'color': _SLATE},
+        'tickangle': 45,
+    },
+    'yaxis': {
+        'showgrid': True,
+        'gridcolor': 'rgba(148, 163, 184, 0.1)',
+        'zeroline': True,
+        'zerolinecolor': 'rgba(148, 163, 184, 0.5)',
+        'zerolinewidth': 1,
+        'ticksuffix': '%',
+        'tickfont': {'size': 12, 'color': _SLATE},
+        'title': {'font': {'size': 14, 'color': _SLATE}},
+    },
+    'autosize': True,
+}
+
+@lru_cache(maxsize=1)
+def _market_template():
+    """Register the 'market' template on first use and return it merged over the active default template.
+
+    Merging loads and validates the full default template, so it is deferred until a plotly chart is actually
+    drawn. Returns the Template, its dict form and its encoded JSON; the JSON is spliced into every figure.
+    """
+    pio.templates['market'] = go.layout.Template(layout=_MARKET_LAYOUT)
+    template = pio.templates[f'{pio.templates.default}+market']
+    template_json = template.to_plotly_json()
+    return template, template_json, pio.json.to_json_plotly(template_json, engine='orjson')
+
+def _figure_json(traces, layout: Dict) -> str:
+    """Serialize a plain-dict figure styled with the market template, splicing in the pre-encoded template."""
+    data_json = pio.json.to_json_plotly(traces, engine='orjson')
+    layout_json = pio.json.to_json_plotly(layout, engine='orjson')
+    template_str = _market_template()[2]
+    return f'{{"data":{data_json},"layout":{layout_json[:-1]},"template":{template_str}}}}}'
+
+# Per-chart settings for the economic indicator charts rendered by _render_chart
+_CHART_SPECS = {
+    'gdp': {
+        'name': 'GDP',
+        'build': _build_gdp,
+        'filename': 'gdp_chart.html',
+        'title': 'Real GDP Growth',
+        'font': {'family': '"Open Sans", verdana, arial, sans-serif'},
+        'yaxis_title': 'Growth Rate',
+        'range_pad': 1,
+        'tickformat': '.1f',
+        # Zero line, healthy growth range (2-3%) and optimal range (3.5-4.5%)
+        'hlines': [{'y': 0}],
+        'hrects': [(2, 3, 'rgba(59, 130, 246, 0.1)'), (3.5, 4.5, 'rgba(74, 222, 128, 0.1)')],
+    },
+    'inflation': {
+        'name': 'inflation',
+        'build': _build_inflation,
+        'filename': 'inflation_chart.html',
+        'title': 'Inflation Rate',
+        'yaxis_title': 'Inflation Rate',
+        'range_pad': 0.5,
+        'tickformat': '.1f',
+        # Target inflation line and target range
+        'hlines': [{'y': 2, 'dash': 'dash'}],
+        'hrects': [(2.0, 2.5, 'rgba(34, 197, 94, 0.08)')],
+    },
+    'unemployment': {
+        'name': 'unemployment',
+        'build': _build_unemployment,
+        'filename': 'unemployment_chart.html',
+        'title': 'Unemployment Rate',
+        'yaxis_title': 'Unemployment Rate',
+        'range_pad': 0.5,
+        'tickformat': '.1f',
+        # Full employment line and optimal range
+        'hlines': [{'y': 4, 'dash': 'dash'}],
+        'hrects': [(3.5, 4.0, 'rgba(34, 197, 94, 0.08)')],
+    },
+    'bond': {
+        'name': 'bond',
+        'build': _build_bond,
+        'filename': 'bond_chart.html',
+        'title': 'Treasury Yields',
+        'yaxis_title': 'Yield',
+        'range_pad': 0.5,
+        'tickformat': '.2f',
+        'legend': {
+            'yanchor': 'top',
+            'y': 0.99,
+            'xanchor': 'left',
+            'x': 0.01,
+            'bgcolor': 'rgba(0,0,0,0)',
+            'bordercolor': 'rgba(0,0,0,0)',
+            'borderwidth': 0,
+            'font': {'color': _SLATE, 'size': 12}
+        },
+    },
+    # Single maturity yield charts; filename and title are supplied per call
+    'yield': {
+        'build': _build_yield,
+        'yaxis_title': 'Yield',
+        'range_pad': 0.5,
+        'tickformat': '.2f',
+        'config': {**_WRITE_CONFIG, 'autosizable': True, 'fillFrame': True},
+    },
+}
+
+def _y_range(y_series, pad: float):
+    """Padded y-axis range over every plotted series, reducing each one separately instead of concatenating them."""
+    return [min(np.min(v) for v in y_series) - pad, max(np.max(v) for v in y_series) + pad]
+
+def _reference_shapes(spec: Dict):
+    """Full-width reference lines and shaded target bands declared by a chart spec."""
+    return [
+        *({
+            'type': 'line',
+            'xref': 'x domain', 'yref': 'y',
+            'x0': 0, 'x1': 1,
+            'y0': line['y'], 'y1': line['y'],
+            'line': {'color': 'rgba(148, 163, 184, 0.5)', 'width': 1, 'dash': line.get('dash', 'solid')},
+        } for line in spec.get('hlines', ())),
+        *({
+            'type': 'rect',
+            'xref': 'x domain', 'yref': 'y',
+            'x0': 0, 'x1': 1,
+            'y0': y0, 'y1': y1,
+            'fillcolor': fillcolor,
+            'line': {'width': 0},
+        } for y0, y1, fillcolor in spec.get('hrects', ())),
+    ]
+
+# Bump when chart rendering changes, so charts whose inputs have not changed are still redrawn once
+_CHART_CACHE_VERSION = 1
+
+def _input_digest(*parts) -> Optional[str]:
+    """Digest of everything a chart file is rendered from, or None when the inputs cannot be serialized."""
     try:
-        labels = data['labels']
-        values = data['values']
-        # Color coding: green for target (2-2.5%), yellow for below target, red for above target
-        colors = [
-            'rgb(34, 197, 94)' if 2.0 <= v <= 2.5 else ('rgb(234, 179, 8)' if v < 2.0 else 'rgb(239, 68, 68)')
-            for v in values
-        ]
-        fig = go.Figure(data=[
-            go.Bar(
-                x=labels,
-                y=values,
-                marker_color=colors,
-                text=[f"{v:.1f}%" for v in values],
-                textposition='outside',
-                textfont={'size': 14, 'color': '#94a3b8'},
-                hovertemplate="<b>%{x}</b><br>Inflation: %{y:.1f}%<extra></extra>"
-            )
-        ])
-        fig.update_layout(
-            title={
-                'text': 'Inflation Rate',
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top',
-                'font': {'color': 'rgb(148, 163, 184)', 'size': 28}
-            },
-            plot_bgcolor='rgb(13, 18, 30)',
-            paper_bgcolor='rgb(13, 18, 30)',
-            font={'color': 'rgb(148, 163, 184)', 'size': 14, 'family': 'system-ui'},
-            showlegend=False,
-            margin=dict(t=60, l=50, r=30, b=80),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title=None,
-                tickangle=45
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                zeroline=True,
-                zerolinecolor='rgba(148, 163, 184, 0.5)',
-                zerolinewidth=1,
-                ticksuffix='%',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title={'text': 'Inflation Rate', 'font': {'size': 14, 'color': 'rgb(148, 163, 184)'}},
-                range=[min(values) - 0.5, max(values) + 0.5],
-                tickformat='.1f'
-            ),
-            autosize=True
-        )
-        # Add target inflation line
-        fig.add_hline(
-            y=2,
-            line_color='rgba(148, 163, 184, 0.5)',
-            line_width=1,
-            line_dash='dash'
-        )
-        # Add target range shadow
-        fig.add_hrect(
-            y0=2.0, y1=2.5,
-            fillcolor="rgba(34, 197, 94, 0.08)",
-            line_width=0
-        )
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
-        chart_path = os.path.join(charts_dir, 'inflation_chart.html')
-        fig.write_html(
-            chart_path,
-            include_plotlyjs=True,
-            full_html=True,
-            config={
-                'displayModeBar': False,
-                'responsive': True
-            }
-        )
-        return os.path.relpath(chart_path, output_dir)
-    except Exception as e:
-        print(f"ERROR - Failed to generate inflation chart: {e}")
+        payload = orjson.dumps((_CHART_CACHE_VERSION, get_plotlyjs_version(), PLOTLYJS_MODE, *parts),
+                               option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
         return None
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-def generate_unemployment_chart(data: Dict, output_dir: str) -> Optional[str]:
-    """Generate unemployment chart as a bar chart using Plotly."""
+# Input digest of each chart file this process last wrote, keyed by path; kept in memory so nothing extra
+# lands in the published report directories. Oldest entries are dropped past _MAX_CHART_DIGESTS.
+_chart_digests: Dict[str, str] = {}
+_chart_digests_lock = threading.Lock()
+_MAX_CHART_DIGESTS = 256
+
+def _chart_is_current(chart_path: str, digest: Optional[str]) -> bool:
+    """Whether chart_path exists and was last written by this process from the same input digest."""
+    return digest is not None and _chart_digests.get(chart_path) == digest and os.path.exists(chart_path)
+
+def _record_digest(chart_path: str, digest: Optional[str]) -> None:
+    """Remember the input digest of a freshly written chart."""
+    if digest is not None:
+        with _chart_digests_lock:
+            _chart_digests.pop(chart_path, None)
+            if len(_chart_digests) >= _MAX_CHART_DIGESTS:
+                del _chart_digests[next(iter(_chart_digests))]
+            _chart_digests[chart_path] = digest
+
+def _render_chart(kind: str, data: Dict, output_dir: str,
+                  embed_mode: Literal['standalone', 'fragment'] = 'standalone', **spec_overrides) -> Optional[str]:
+    """Build, lay out and save one of the economic indicator charts described in _CHART_SPECS.
+
+    embed_mode='fragment' writes <name>_chart.frag.html, a div and script for a page that loads plotly.js once.
+    spec_overrides replace individual _CHART_SPECS entries for this call, e.g. the filename and title of a yield chart.
+    Charts this process already wrote from identical inputs are left as they are.
+    """
+    spec = {**_CHART_SPECS[kind], **spec_overrides} if spec_overrides else _CHART_SPECS[kind]
     try:
-        labels = data['labels']
-        values = data['values']
-        # Color coding: green for <=4.0, yellow for <=4.4, red for >4.4
-        colors = [
-            'rgb(34, 197, 94)' if v <= 4.0 else ('rgb(234, 179, 8)' if v <= 4.4 else 'rgb(239, 68, 68)')
-            for v in values
-        ]
-        fig = go.Figure(data=[
-            go.Bar(
-                x=labels,
-                y=values,
-                marker_color=colors,
-                text=[f"{v:.1f}%" for v in values],
-                textposition='outside',
-                textfont={'size': 14, 'color': '#94a3b8'},
-                hovertemplate="<b>%{x}</b><br>Unemployment: %{y:.1f}%<extra></extra>"
-            )
-        ])
-        fig.update_layout(
-            title={
-                'text': 'Unemployment Rate',
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top',
-                'font': {'color': 'rgb(148, 163, 184)', 'size': 28}
+        chart_path = _chart_file(output_dir, spec['filename'], embed_mode)
+        digest = _input_digest(kind, embed_mode, spec_overrides, data)
+        if _chart_is_current(chart_path, digest):
+            if embed_mode != 'fragment':
+                _plotlyjs_mode(chart_path)  # make sure a 'directory' bundle is still beside the chart
+            return _chart_relpath(chart_path)
+        traces, y_series, shapes, xaxis = spec['build'](data)
+        y_range = _y_range(y_series, spec['range_pad'])
+        shapes = [*_reference_shapes(spec), *shapes]
+        layout = {
+            'title': {'text': spec['title']},
+            'showlegend': 'legend' in spec,
+            'yaxis': {
+                'title': {'text': spec['yaxis_title']},
+                'range': y_range,
+                'tickformat': spec['tickformat']
             },
-            plot_bgcolor='rgb(13, 18, 30)',
-            paper_bgcolor='rgb(13, 18, 30)',
-            font={'color': 'rgb(148, 163, 184)', 'size': 14, 'family': 'system-ui'},
-            showlegend=False,
-            margin=dict(t=60, l=50, r=30, b=80),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title=None,
-                tickangle=45
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                zeroline=True,
-                zerolinecolor='rgba(148, 163, 184, 0.5)',
-                zerolinewidth=1,
-                ticksuffix='%',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title={'text': 'Unemployment Rate', 'font': {'size': 14, 'color': 'rgb(148, 163, 184)'}},
-                range=[min(values) - 0.5, max(values) + 0.5],
-                tickformat='.1f'
-            ),
-            autosize=True
-        )
-        # Add full employment line
-        fig.add_hline(
-            y=4,
-            line_color='rgba(148, 163, 184, 0.5)',
-            line_width=1,
-            line_dash='dash'
-        )
-        # Add optimal range shadow
-        fig.add_hrect(
-            y0=3.5, y1=4.0,
-            fillcolor="rgba(34, 197, 94, 0.08)",
-            line_width=0
-        )
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
-        chart_path = os.path.join(charts_dir, 'unemployment_chart.html')
-        fig.write_html(
-            chart_path,
-            include_plotlyjs=True,
-            full_html=True,
-            config={
-                'displayModeBar': False,
-                'responsive': True
-            }
-        )
-        return os.path.relpath(chart_path, output_dir)
-    except Exception as e:
-        print(f"ERROR - Failed to generate unemployment chart: {e}")
-        return None
+        }
+        if 'font' in spec:
+            layout['font'] = spec['font']
+        if xaxis:
+            layout['xaxis'] = xaxis
+        if shapes:
+            layout['shapes'] = shapes
+        if 'legend' in spec:
+            layout['legend'] = spec['legend']
 
-def generate_bond_chart(data: Dict, output_dir: str) -> Optional[str]:
-    """Generate bond yield chart as a line chart using Plotly, highlighting yield curve inversion, with debugging and robust length handling."""
-    try:
-        labels = data['labels']
-        values_10y = data['values']
-        values_2y = data.get('values_2y')
-        # Ensure all lists are the same length
-        n = len(labels)
-        if values_2y:
-            n = min(n, len(values_10y), len(values_2y))
-            if not (len(labels) == len(values_10y) == len(values_2y)):
-                print(f"[DEBUG] Mismatched lengths: labels={len(labels)}, 10Y={len(values_10y)}, 2Y={len(values_2y)}. Trimming to {n}.")
-            labels = labels[:n]
-            values_10y = values_10y[:n]
-            values_2y = values_2y[:n]
+        # Serialize once, straight to the JSON string spliced into the page
+        fig_json = _figure_json(traces, layout)
+        chart_name = os.path.splitext(spec['filename'])[0]
+        config_json = json.dumps(spec['config']) if 'config' in spec else _CONFIG_JSON
+        if embed_mode == 'fragment':
+            _write_chart_json_html(fig_json, chart_path, fragment=True, plot_id=chart_name.replace('_', '-'),
+                                   config_json=config_json)
         else:
-            n = min(n, len(values_10y))
-            if not (len(labels) == len(values_10y)):
-                print(f"[DEBUG] Mismatched lengths: labels={len(labels)}, 10Y={len(values_10y)}. Trimming to {n}.")
-            labels = labels[:n]
-            values_10y = values_10y[:n]
-        print(f"[DEBUG] Chart labels: {labels}")
-        print(f"[DEBUG] 10Y values: {values_10y}")
-        print(f"[DEBUG] 2Y values: {values_2y}")
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=labels,
-            y=values_10y,
-            mode='lines+markers',
-            name='10Y Treasury',
-            line=dict(color='rgb(59, 130, 246)', width=2),
-            marker=dict(size=8, color='rgb(59, 130, 246)'),
-            hovertemplate="<b>%{x}</b><br>10Y Yield: %{y:.2f}%<extra></extra>"
-        ))
-        if values_2y:
-            fig.add_trace(go.Scatter(
-                x=labels,
-                y=values_2y,
-                mode='lines+markers',
-                name='2Y Treasury',
-                line=dict(color='rgb(239, 68, 68)', width=2),
-                marker=dict(size=8, color='rgb(239, 68, 68)'),
-                hovertemplate="<b>%{x}</b><br>2Y Yield: %{y:.2f}%<extra></extra>"
-            ))
-            # Highlight contiguous inversion regions (2Y > 10Y)
-            inversion_regions = []
-            in_inversion = False
-            start_idx = None
-            for i in range(n):
-                if values_2y[i] > values_10y[i]:
-                    if not in_inversion:
-                        in_inversion = True
-                        start_idx = i
-                else:
-                    if in_inversion:
-                        in_inversion = False
-                        inversion_regions.append((start_idx, i-1))
-            if in_inversion:
-                inversion_regions.append((start_idx, n-1))
-            for start, end in inversion_regions:
-                fig.add_vrect(
-                    x0=labels[start],
-                    x1=labels[end],
-                    fillcolor="rgba(239, 68, 68, 0.15)",
-                    line_width=0,
-                    layer="below"
-                )
-        fig.update_layout(
-            title={
-                'text': 'Treasury Yields',
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top',
-                'font': {'color': 'rgb(148, 163, 184)', 'size': 28}
-            },
-            plot_bgcolor='rgb(13, 18, 30)',
-            paper_bgcolor='rgb(13, 18, 30)',
-            font={'color': 'rgb(148, 163, 184)', 'size': 14, 'family': 'system-ui'},
-            showlegend=True,
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font={'color': 'rgb(148, 163, 184)', 'size': 12}
-            ),
-            margin=dict(t=60, l=50, r=30, b=80),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title=None,
-                tickangle=45
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(148, 163, 184, 0.1)',
-                zeroline=True,
-                zerolinecolor='rgba(148, 163, 184, 0.5)',
-                zerolinewidth=1,
-                ticksuffix='%',
-                tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'},
-                title={'text': 'Yield', 'font': {'size': 14, 'color': 'rgb(148, 163, 184)'}},
-                range=[
-                    min(values_10y + (values_2y if values_2y else [])) - 0.5,
-                    max(values_10y + (values_2y if values_2y else [])) + 0.5
-                ],
-                tickformat='.2f'
-            ),
-            autosize=True
-        )
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
-        chart_path = os.path.join(charts_dir, 'bond_chart.html')
-        fig.write_html(
-            chart_path,
-            include_plotlyjs=True,
-            full_html=True,
-            config={
-                'displayModeBar': False,
-                'responsive': True
-            }
-        )
-        return os.path.relpath(chart_path, output_dir)
-    except Exception as e:
-        print(f"ERROR - Failed to generate bond chart: {e}")
+            _write_chart_json_html(fig_json, chart_path, config_json=config_json)
+        _record_digest(chart_path, digest)
+        return _chart_relpath(chart_path)
+    except Exception:
+        logger.exception("Failed to generate %s chart", spec['name'])
         return None
 
+def generate_gdp_chart(data: Dict, output_dir: str,
+                       embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> Optional[str]:
+    """Generate GDP chart using Plotly."""
+    return _render_chart('gdp', data, output_dir, embed_mode=embed_mode)
+
+def generate_inflation_chart(data: Dict, output_dir: str,
+                             embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> Optional[str]:
+    """Generate inflation chart as a bar chart using Plotly."""
+    return _render_chart('inflation', data, output_dir, embed_mode=embed_mode)
+
+def generate_unemployment_chart(data: Dict, output_dir: str,
+                                embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> Optional[str]:
+    """Generate unemployment chart as a bar chart using Plotly."""
+    return _render_chart('unemployment', data, output_dir, embed_mode=embed_mode)
+
+def generate_bond_chart(data: Dict, output_dir: str,
+                        embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> Optional[str]:
+    """Generate bond yield chart as a line chart using Plotly, highlighting yield curve inversion."""
+    return _render_chart('bond', data, output_dir, embed_mode=embed_mode)
+
+# Index names and tickers mapped to TradingView symbols, keyed lowercase for direct lookup
+_TV_SYMBOLS = {k.lower(): v for k, v in {
+    'S&P 500': 'AMEX:SPY',
+    'SPY': 'AMEX:SPY',
+    'Dow Jones': 'AMEX:DIA',
+    'DIA': 'AMEX:DIA',
+    'Nasdaq-100': 'NASDAQ:QQQ',
+    'QQQ': 'NASDAQ:QQQ',
+    'S&P 400 MidCap': 'AMEX:MDY',
+    'MDY': 'AMEX:MDY',
+    'Russell 2000': 'AMEX:IWM',
+    'IWM': 'AMEX:IWM',
+    'S&P 500 Growth': 'AMEX:IVW',
+    'IVW': 'AMEX:IVW',
+    'S&P 500 Value': 'AMEX:IVE',
+    'IVE': 'AMEX:IVE',
+    'UUP': 'AMEX:UUP',
+    'Oil (WTI)': 'TVC:USOIL',
+    'USO': 'AMEX:USO',
+    'VIX': 'AMEX:VIXY',
+    'VIXY': 'AMEX:VIXY',
+}.items()}
+_TV_SYMBOL_ITEMS = tuple(_TV_SYMBOLS.items())
+# Strips everything but letters when falling back to a ticker derived from the index name
+_TICKER_RE = re.compile(r'[^A-Z]')
+
+_WIDGET_TEMPLATE = '''
+<!-- TradingView Widget BEGIN -->
+<html>
+<head></head>
+<body style="height:900px; margin:0; padding:0;">
+<div class="tradingview-widget-container" style="height:900px;">
+  <div id="tradingview_{safe_name}"></div>
+  <script type="text/javascript" src="https://s3.tradingview.com/tv.js"></script>
+  <script type="text/javascript">
+  new TradingView.widget({{
+    "width": "100%",
+    "height": 900,
+    "symbol": "{tv_symbol}",
+    "interval": "D",
+    "timezone": "Etc/UTC",
+    "theme": "dark",
+    "style": "1",
+    "locale": "en",
+    "toolbar_bg": "#131722",
+    "enable_publishing": false,
+    "hide_top_toolbar": false,
+    "save_image": false,
+    "container_id": "tradingview_{safe_name}"
+  }});
+  </script>
+</div>
+</body>
+</html>
+<!-- TradingView Widget END -->
+'''
+
+# Layout of the Dollar Index candlestick chart
+_DOLLAR_INDEX_LAYOUT = {
+    'title': {'text': 'Dollar Index (DXY)', 'y': 0.95, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top',
+              'font': {'color': _SLATE, 'size': 28}},
+    'plot_bgcolor': 'rgba(15,23,42,1)',
+    'paper_bgcolor': 'rgba(15,23,42,1)',
+    'font': {'color': 'rgb(226,232,240)', 'size': 16},
+    'margin': {'l': 30, 'r': 30, 't': 60, 'b': 30},
+    'xaxis': {'title': '', 'showgrid': False, 'zeroline': False, 'rangeslider': {'visible': True}, 'type': 'date'},
+    'yaxis': {'title': '', 'showgrid': True, 'gridcolor': 'rgba(51,65,85,0.4)', 'zeroline': False},
+    'hovermode': 'x unified',
+    'autosize': True,
+}
+
 def generate_market_index_chart(data: Dict, output_dir: str, index_name: str) -> Optional[str]:
     """Generate a chart HTML file for a market index ETF. Use Plotly for Dollar Index, TradingView for others."""
     # Special case for Dollar Index
     if index_name == 'Dollar Index' and data and data.get('labels'):
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
+        charts_dir = _charts_dir(output_dir)
         chart_path = os.path.join(charts_dir, 'dollar_index_chart.html')
         # Use OHLC data if available
         if 'ohlc' in data and all(k in data['ohlc'] for k in ['open', 'high', 'low', 'close']):
@@ -473,141 +628,48 @@ def generate_market_index_chart(data: Dict, output_dir: str, index_name: str) ->
             high=df['high'],
             low=df['low'],
             close=df['close'],
-            increasing_line_color='rgb(34, 197, 94)',
-            decreasing_line_color='rgb(239, 68, 68)'
+            increasing_line_color=_GREEN,
+            decreasing_line_color=_RED
         )])
-        fig.update_layout(
-            title={'text': 'Dollar Index (DXY)', 'y': 0.95, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top', 'font': {'color': 'rgb(148, 163, 184)', 'size': 28}},
-            plot_bgcolor='rgba(15,23,42,1)',
-            paper_bgcolor='rgba(15,23,42,1)',
-            font=dict(color='rgb(226,232,240)', size=16),
-            margin=dict(l=30, r=30, t=60, b=30),
-            xaxis=dict(title='', showgrid=False, zeroline=False, rangeslider=dict(visible=True), type='date'),
-            yaxis=dict(title='', showgrid=True, gridcolor='rgba(51,65,85,0.4)', zeroline=False),
-            hovermode='x unified',
-            autosize=True
-        )
-        pio.write_html(fig, file=chart_path, auto_open=False, include_plotlyjs='cdn', full_html=True, config={'displayModeBar': False, 'responsive': True})
-        return os.path.relpath(chart_path, output_dir)
+        fig.update_layout(_DOLLAR_INDEX_LAYOUT)
+        _write_chart_html(fig, chart_path)
+        return _chart_relpath(chart_path)
     # Otherwise, use TradingView as before
-    logger.debug(f"Generating TradingView chart for {index_name}")
-    # Map index names and tickers to correct TradingView symbols
-    tradingview_symbol_map = {
-        'S&P 500': 'AMEX:SPY',
-        'SPY': 'AMEX:SPY',
-        'Dow Jones': 'AMEX:DIA',
-        'DIA': 'AMEX:DIA',
-        'Nasdaq-100': 'NASDAQ:QQQ',
-        'QQQ': 'NASDAQ:QQQ',
-        'S&P 400 MidCap': 'AMEX:MDY',
-        'MDY': 'AMEX:MDY',
-        'Russell 2000': 'AMEX:IWM',
-        'IWM': 'AMEX:IWM',
-        'S&P 500 Growth': 'AMEX:IVW',
-        'IVW': 'AMEX:IVW',
-        'S&P 500 Value': 'AMEX:IVE',
-        'IVE': 'AMEX:IVE',
-        'UUP': 'AMEX:UUP',
-        'Oil (WTI)': 'TVC:USOIL',
-        'USO': 'AMEX:USO',
-        'VIX': 'AMEX:VIXY',
-        'VIXY': 'AMEX:VIXY',
-    }
-    # Try to match by name or ticker
-    tv_symbol = None
-    for k, v in tradingview_symbol_map.items():
-        if k.lower() in index_name.lower() or k.lower() == index_name.lower():
-            tv_symbol = v
-            break
+    logger.debug("Generating TradingView chart for %s", index_name)
+    # Exact name/ticker lookup first, then the first key contained in the index name
+    key = index_name.lower()
+    tv_symbol = _TV_SYMBOLS.get(key)
+    if not tv_symbol:
+        tv_symbol = next((v for k, v in _TV_SYMBOL_ITEMS if k in key), None)
     if not tv_symbol:
         # Fallback: try to extract ticker from data or index_name and use AMEX as default
-        ticker = re.sub(r'[^A-Z]', '', index_name.upper())
+        ticker = _TICKER_RE.sub('', index_name.upper())
         tv_symbol = f'AMEX:{ticker}'
-        logger.debug(f"Fallback TradingView symbol: {tv_symbol} for index {index_name}")
-    logger.debug(f"Final TradingView symbol for {index_name}: {tv_symbol}")
-    safe_name = index_name.lower().replace(' ', '_').replace('&', 'and')
-    charts_dir = os.path.join(output_dir, 'charts')
-    os.makedirs(charts_dir, exist_ok=True)
+        logger.debug("Fallback TradingView symbol: %s for index %s", tv_symbol, index_name)
+    logger.debug("Final TradingView symbol for %s: %s", index_name, tv_symbol)
+    safe_name = key.replace(' ', '_').replace('&', 'and')
+    charts_dir = _charts_dir(output_dir)
     chart_path = os.path.join(charts_dir, f'{safe_name}_chart.html')
-    widget_html = f'''
-<!-- TradingView Widget BEGIN -->
-<html>
-<head></head>
-<body style="height:900px; margin:0; padding:0;">
-<div class="tradingview-widget-container" style="height:900px;">
-  <div id="tradingview_{safe_name}"></div>
-  <script type="text/javascript" src="https://s3.tradingview.com/tv.js"></script>
-  <script type="text/javascript">
-  new TradingView.widget({{
-    "width": "100%",
-    "height": 900,
-    "symbol": "{tv_symbol}",
-    "interval": "D",
-    "timezone": "Etc/UTC",
-    "theme": "dark",
-    "style": "1",
-    "locale": "en",
-    "toolbar_bg": "#131722",
-    "enable_publishing": false,
-    "hide_top_toolbar": false,
-    "save_image": false,
-    "container_id": "tradingview_{safe_name}"
-  }});
-  </script>
-</div>
-</body>
-</html>
-<!-- TradingView Widget END -->
-'''
+    widget_html = _WIDGET_TEMPLATE.format(safe_name=safe_name, tv_symbol=tv_symbol)
     try:
-        with open(chart_path, 'w', encoding='utf-8') as f:
-            f.write(widget_html)
-        logger.info(f"TradingView chart for {index_name} saved to {chart_path}")
-        return os.path.relpath(chart_path, output_dir)
-    except Exception as e:
-        logger.error(f"Failed to generate TradingView chart for {index_name}: {e}")
+        _write_file(chart_path, widget_html)
+        logger.info("TradingView chart for %s saved to %s", index_name, chart_path)
+        return _chart_relpath(chart_path)
+    except Exception:
+        logger.exception("Failed to generate TradingView chart for %s", index_name)
         return None
 
-def generate_single_bond_chart(data: Dict, output_dir: str, filename: str, title: str) -> Optional[str]:
-    try:
-        labels = data['labels']
-        values = data['values']
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=labels,
-            y=values,
-            mode='lines+markers',
-            name=title,
-            line=dict(color='rgb(59, 130, 246)', width=2),
-            marker=dict(size=8, color='rgb(59, 130, 246)'),
-            hovertemplate=f"<b>%{{x}}</b><br>{title}: %{{y:.2f}}%<extra></extra>"
-        ))
-        fig.update_layout(
-            title={'text': title, 'y': 0.95, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top', 'font': {'color': 'rgb(148, 163, 184)', 'size': 28}},
-            plot_bgcolor='rgb(13, 18, 30)',
-            paper_bgcolor='rgb(13, 18, 30)',
-            font={'color': 'rgb(148, 163, 184)', 'size': 14, 'family': 'system-ui'},
-            showlegend=False,
-            margin=dict(t=60, l=50, r=30, b=80),
-            xaxis=dict(showgrid=True, gridcolor='rgba(148, 163, 184, 0.1)', tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'}, title=None, tickangle=45),
-            yaxis=dict(showgrid=True, gridcolor='rgba(148, 163, 184, 0.1)', zeroline=True, zerolinecolor='rgba(148, 163, 184, 0.5)', zerolinewidth=1, ticksuffix='%', tickfont={'size': 12, 'color': 'rgb(148, 163, 184)'}, title={'text': 'Yield', 'font': {'size': 14, 'color': 'rgb(148, 163, 184)'}}, range=[min(values) - 0.5, max(values) + 0.5], tickformat='.2f'),
-            autosize=True
-        )
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
-        chart_path = os.path.join(charts_dir, filename)
-        fig.write_html(
-            chart_path,
-            include_plotlyjs=True,
-            full_html=True,
-            config={'displayModeBar': False, 'responsive': True, 'autosizable': True, 'fillFrame': True}
-        )
-        return os.path.relpath(chart_path, output_dir)
-    except Exception as e:
-        print(f"ERROR - Failed to generate {title} chart: {e}")
-        return None
+def generate_single_bond_chart(data: Dict, output_dir: str, filename: str, title: str,
+                               embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> Optional[str]:
+    """Generate a single Treasury yield line chart using Plotly."""
+    return _render_chart('yield', {**data, 'title': title}, output_dir, embed_mode=embed_mode,
+                         filename=filename, title=title, name=title)
 
-def generate_style_box_heatmap(data: Dict, output_dir: str) -> Optional[str]:
+# Red below zero, green above, with a hard step at the midpoint
+_HEATMAP_COLORSCALE = [[0, "#f87171"], [0.5, "#fca5a5"], [0.5, "#bbf7d0"], [1, "#4ade80"]]
+
+def generate_style_box_heatmap(data: Dict, output_dir: str,
+                               embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> Optional[str]:
     """Generate a style box heatmap (Value/Core/Growth x Large/Mid/Small) using Plotly."""
     try:
         # data: {"z": [[...], [...], [...]], "x": ["Value", "Core", "Growth"], "y": ["Large", "Mid", "Small"]}
@@ -635,7 +697,7 @@ def generate_style_box_heatmap(data: Dict, output_dir: str) -> Optional[str]:
             y=y,
             text=text,
             texttemplate="%{text}",
-            colorscale=[[0, "#f87171"], [0.5, "#fca5a5"], [0.5, "#bbf7d0"], [1, "#4ade80"]],
+            colorscale=_HEATMAP_COLORSCALE,
             zmin=-1.5,
             zmax=1.5,
             showscale=False,
@@ -658,14 +720,14 @@ def generate_style_box_heatmap(data: Dict, output_dir: str) -> Optional[str]:
                 'x': 0.5,
                 'xanchor': 'center',
                 'yanchor': 'top',
-                'font': {'color': 'rgb(148, 163, 184)', 'size': 30}
+                'font': {'color': _SLATE, 'size': 30}
             },
-            plot_bgcolor='rgb(13, 18, 30)',
-            paper_bgcolor='rgb(13, 18, 30)',
-            font={'color': 'rgb(148, 163, 184)', 'size': 20, 'family': 'system-ui'},
+            plot_bgcolor=_BG,
+            paper_bgcolor=_BG,
+            font={'color': _SLATE, 'size': 20, 'family': 'system-ui'},
             margin=dict(t=30, l=40, r=40, b=40),
-            xaxis=dict(title='', side='top', tickmode='array', tickvals=list(range(len(x))), ticktext=x, showgrid=False, tickfont={'size': 18, 'color': 'rgb(148, 163, 184)'}, automargin=True),
-            yaxis=dict(title='', autorange='reversed', tickmode='array', tickvals=list(range(len(y))), ticktext=y, showgrid=False, tickfont={'size': 18, 'color': 'rgb(148, 163, 184)'}, automargin=True),
+            xaxis=dict(title='', side='top', tickmode='array', tickvals=list(range(len(x))), ticktext=x, showgrid=False, tickfont={'size': 18, 'color': _SLATE}, automargin=True),
+            yaxis=dict(title='', autorange='reversed', tickmode='array', tickvals=list(range(len(y))), ticktext=y, showgrid=False, tickfont={'size': 18, 'color': _SLATE}, automargin=True),
             autosize=True,
             height=320,
         )
@@ -677,16 +739,43 @@ def generate_style_box_heatmap(data: Dict, output_dir: str) -> Optional[str]:
             showlegend=False,
             hoverinfo='skip'
         ))
-        charts_dir = os.path.join(output_dir, 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
-        chart_path = os.path.join(charts_dir, 'style_box_heatmap.html')
-        fig.write_html(
-            chart_path,
-            include_plotlyjs=True,
-            full_html=True,
-            config={'displayModeBar': False, 'responsive': True}
-        )
-        return os.path.relpath(chart_path, output_dir)
-    except Exception as e:
-        print(f"ERROR - Failed to generate style box heatmap: {e}")
-        return None 
\ No newline at end of file
+        chart_path = _chart_file(output_dir, 'style_box_heatmap.html', embed_mode)
+        _write_chart_html(fig, chart_path, fragment_id='style-box-heatmap' if embed_mode == 'fragment' else None)
+        return _chart_relpath(chart_path)
+    except Exception:
+        logger.exception("Failed to generate style box heatmap")
+        return None 
+
+def generate_all_charts(data_by_type: Dict, output_dir: str, max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """Generate independent market charts concurrently on a small thread pool.
+
+    data_by_type may hold 'gdp', 'inflation', 'unemployment' and 'bond' chart data, 'style_box' heatmap data,
+    'single_bonds' as {filename: (data, title)} and 'indices' as {index_name: history data}. Missing or empty
+    entries are skipped. Returns chart relpaths keyed by chart kind, single bond filename or index name.
+    """
+    jobs = {}
+    for kind, func in (('gdp', generate_gdp_chart), ('inflation', generate_inflation_chart),
+                       ('unemployment', generate_unemployment_chart), ('bond', generate_bond_chart)):
+        if data_by_type.get(kind):
+            jobs[kind] = (func, data_by_type[kind], output_dir)
+    if data_by_type.get('style_box'):
+        jobs['style_box'] = (generate_style_box_heatmap, data_by_type['style_box'], output_dir)
+    for filename, (data, title) in (data_by_type.get('single_bonds') or {}).items():
+        jobs[filename] = (generate_single_bond_chart, data, output_dir, filename, title)
+    for index_name, data in (data_by_type.get('indices') or {}).items():
+        jobs[index_name] = (generate_market_index_chart, data, output_dir, index_name)
+    if not jobs:
+        return {}
+    ensure_charts_dir(output_dir)
+    # Threads rather than processes: the jobs are millisecond-scale figure builds, this also runs inside the
+    # multi-threaded API server (where forking is unsafe), and anything a worker records stays in this process
+    with ThreadPoolExecutor(max_workers=min(len(jobs), max_workers or os.cpu_count() or 1)) as executor:
+        futures = {key: executor.submit(*job) for key, job in jobs.items()}
+        results = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception:
+                logger.exception("Chart worker failed for %s", key)
+                results[key] = None
+    return results
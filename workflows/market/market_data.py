@@ -2,24 +2,199 @@
 Market data fetcher for economic indicators and market data.
 """
 
+import copy
+import csv
+import inspect
+import io
 import os
-import json
 import logging
+import numpy as np
+import orjson
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pytz
+import threading
 import time
 import yfinance as yf
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 from typing import Dict, Optional
 from polygon import RESTClient
 from polygon.rest.models import Timeframe, Sort, Order
 from workflows.base_fetcher import BaseFetcher
 from utils.config import POLYGON_API_KEY, FRED_API_KEY, TRADING_ECON_API_KEY
-from utils.most_recent import with_most_recent_data
 
 logger = logging.getLogger(__name__)
 
+_FRED_URL = "https://api.stlouisfed.org/fred/series/observations"
+_FREDGRAPH_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+_FRED_BASE_PARAMS = {'file_type': 'json', 'sort_order': 'desc'}
+# Polygon REST URLs with the API key baked in; format with the snapshot list or ticker
+_POLYGON_SNAPSHOT_URL = "https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/{}?apiKey=" + POLYGON_API_KEY
+_POLYGON_NEWS_URL = "https://api.polygon.io/v2/reference/news?ticker={}&limit=1&apiKey=" + POLYGON_API_KEY
+_POLYGON_BATCH_NEWS_URL = "https://api.polygon.io/v2/reference/news?ticker.any_of={}&limit={}&order=desc&sort=published_utc&apiKey=" + POLYGON_API_KEY
+_NEWS_PER_TICKER = 10  # articles requested per ticker in a batched news lookup
+_HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+_ET = pytz.timezone('US/Eastern')
+
+# Market session boundaries in minutes since midnight ET
+_PRE_MARKET_START = 4 * 60
+_MARKET_OPEN = 9 * 60 + 30
+_MARKET_CLOSE = 16 * 60
+_AFTER_HOURS_CLOSE = 20 * 60
+_SESSION_BOUNDARIES = (_PRE_MARKET_START, _MARKET_OPEN, _MARKET_CLOSE, _AFTER_HOURS_CLOSE)
+# (status, hours) for each span between the session boundaries, indexed with bisect_right
+_SESSION_STATUS = (
+    ('Closed', 'Pre-Market Trading starts at 4:00 AM ET'),
+    ('Pre-Market', 'Regular Trading starts at 9:30 AM ET'),
+    ('Open', 'Regular Trading Hours (9:30 AM - 4:00 PM ET)'),
+    ('After-Hours', 'After-Hours Trading (until 8:00 PM ET)'),
+    ('Closed', 'Market Closed - Opens at 4:00 AM ET'),
+)
+
+
+_EMPTY_INDICATOR = {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'}
+_EMPTY_INDEX = {'value': 'N/A', 'change': 'N/A', 'direction': 'neutral'}
+_EMPTY_RATES = {'Federal Funds Rate': 'N/A', '10-Year Treasury': 'N/A', '30-Year Fixed Mortgage': 'N/A'}
+
+
+# Process-level memo of recent API results shared by all fetcher instances and threads
+_RESPONSE_CACHE = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+# Per-key [lock, waiters] for keys with a call in flight; an entry is dropped once its last waiter leaves
+_RESPONSE_KEY_LOCKS = {}
+
+# Months of CPIAUCSL requested by both the indicator cards and the inflation chart,
+# so the two share one memoized FRED response
+_CPI_MONTHS = 20
+
+# Hours a FRED series response stays in the shared cache, kept well under each series'
+# release interval (weekly MORTGAGE30US, monthly FEDFUNDS/CPIAUCSL/UNRATE, quarterly GDP).
+# Daily series such as DGS10 are not listed and only use the in-process memo.
+_FRED_SERIES_TTL_HOURS = {
+    'MORTGAGE30US': 24,
+    'FEDFUNDS': 3 * 24,
+    'CPIAUCSL': 3 * 24,
+    'UNRATE': 3 * 24,
+    'A191RL1Q225SBEA': 7 * 24,
+}
+
+
+def _ttl_cached(ttl: float, keep=bool):
+    """Memoize a fetcher method's result for ttl seconds, keyed by method name and arguments.
+
+    Results for which keep(result) is false (failed or empty fetches) are not cached, and
+    fetchers created with force_refresh always go to the network. Concurrent calls with
+    the same key wait for the first one instead of issuing duplicate requests. Every
+    caller gets its own deep copy, so mutating a result never changes the memo.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def memo_key(self, args, kwargs):
+            # Bind to the signature so positional, keyword and defaulted spellings of a call share one key
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return (func.__name__, *tuple(bound.arguments.items())[1:])
+
+        def call(self, key, args, kwargs):
+            result = func(self, *args, **kwargs)
+            if keep(result):
+                cached = copy.deepcopy(result)
+                with _RESPONSE_CACHE_LOCK:
+                    _RESPONSE_CACHE[key] = (time.monotonic(), cached)
+            return result
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = memo_key(self, args, kwargs)
+            if self.force_refresh:
+                return call(self, key, args, kwargs)
+            with _RESPONSE_CACHE_LOCK:
+                entry = _RESPONSE_KEY_LOCKS.setdefault(key, [threading.Lock(), 0])
+                entry[1] += 1
+            try:
+                with entry[0]:
+                    with _RESPONSE_CACHE_LOCK:
+                        hit = _RESPONSE_CACHE.get(key)
+                    if hit and time.monotonic() - hit[0] < ttl:
+                        return copy.deepcopy(hit[1])
+                    return call(self, key, args, kwargs)
+            finally:
+                with _RESPONSE_CACHE_LOCK:
+                    entry[1] -= 1
+                    if not entry[1]:
+                        del _RESPONSE_KEY_LOCKS[key]
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _polygon_client() -> RESTClient:
+    """Process-wide Polygon REST client, reused by every fetcher instance and thread."""
+    return RESTClient(POLYGON_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def _http_session() -> requests.Session:
+    """Process-wide pooled session so every fetcher instance reuses warm connections."""
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    session.mount('https://', HTTPAdapter(
+        pool_connections=16, pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    ))
+    return session
+
+
+def _empty_indicators(last_updated: str) -> Dict:
+    """Fallback payload for fetch_economic_indicators when nothing could be fetched."""
+    return {
+        'GDP': _EMPTY_INDICATOR.copy(),
+        'Inflation': _EMPTY_INDICATOR.copy(),
+        'Unemployment': _EMPTY_INDICATOR.copy(),
+        'Last Updated': last_updated
+    }
+
+
+def _month_end_labels(periods: int) -> list:
+    """'YYYY-MM' labels for the last `periods` completed month-ends, oldest first."""
+    today = datetime.now()
+    end = today.year * 12 + today.month - 1
+    if (today + timedelta(days=1)).month == today.month:
+        end -= 1  # current month has not ended yet
+    return [f"{(end - k) // 12:04d}-{(end - k) % 12 + 1:02d}" for k in range(periods - 1, -1, -1)]
+
+
+def _split_observations(observations) -> tuple:
+    """ISO dates and float values of FRED observations in one pass, skipping missing ('.') values."""
+    dates, values = [], []
+    for obs in observations:
+        if obs['value'] == '.':
+            continue
+        dates.append(obs['date'])
+        values.append(float(obs['value']))
+    return dates, values
+
+
+def _ym(s: str) -> str:
+    """'YYYY-MM' label for a FRED 'YYYY-MM-DD' date."""
+    return s[:7]
+
+
+def _yq(s: str) -> str:
+    """'Qn YYYY' label for a FRED 'YYYY-MM-DD' date."""
+    return f"Q{(int(s[5:7]) - 1) // 3 + 1} {s[:4]}"
+
+
+def _fmt_date(s: str) -> str:
+    """Reformat a FRED 'YYYY-MM-DD' date as 'MM/DD/YY' without strptime."""
+    return f"{s[5:7]}/{s[8:10]}/{s[2:4]}"
+
+
 class MarketDataFetcher(BaseFetcher):
     """Fetches market data from various sources."""
     
@@ -31,21 +206,31 @@ class MarketDataFetcher(BaseFetcher):
         """
         super().__init__(force_refresh=force_refresh, cache_subdir='market')
         self.force_refresh = force_refresh
-        self.client = RESTClient(POLYGON_API_KEY)  # Initialize Polygon client with API key
+        self.client = _polygon_client()  # Shared Polygon client with API key
         self.fred_api_key = FRED_API_KEY
+        self._fred_static = {**_FRED_BASE_PARAMS, 'api_key': self.fred_api_key}
+        self._http = _http_session()  # Keep-alive session shared by all FRED/Polygon HTTP calls
+        # Token bucket for Yahoo Finance: at most _yahoo_max_requests per window
+        self._yahoo_max_requests = 5
+        self._yahoo_window_seconds = 60
+        self._yahoo_tokens = self._yahoo_max_requests
+        self._yahoo_last_refill = time.monotonic()
+        self._yahoo_refill_rate = self._yahoo_max_requests / self._yahoo_window_seconds
     
     def _yahoo_rate_limited(self):
-        now = time.time()
-        # Remove requests older than window
-        self._yahoo_last_requests = [t for t in self._yahoo_last_requests if now - t < self._yahoo_window_seconds]
-        if len(self._yahoo_last_requests) >= self._yahoo_max_requests:
+        now = time.monotonic()
+        # Refill tokens for the time elapsed since the last call
+        self._yahoo_tokens = min(self._yahoo_max_requests,
+                                 self._yahoo_tokens + (now - self._yahoo_last_refill) * self._yahoo_refill_rate)
+        self._yahoo_last_refill = now
+        if self._yahoo_tokens < 1:
             return True
-        self._yahoo_last_requests.append(now)
+        self._yahoo_tokens -= 1
         return False
 
     def _get_yahoo_price(self, ticker):
         if self._yahoo_rate_limited():
-            logger.warning(f"Yahoo Finance rate limit reached, skipping {ticker}")
+            logger.warning("Yahoo Finance rate limit reached, skipping %s", ticker)
             return 'N/A', 'N/A', 'neutral'
         try:
             data = yf.Ticker(ticker)
@@ -56,32 +241,60 @@ class MarketDataFetcher(BaseFetcher):
                 change = ((current - previous) / previous) * 100 if previous != 0 else 0
                 return f"{current:.2f}", f"{change:+.2f}%", 'up' if change > 0 else 'down' if change < 0 else 'neutral'
         except Exception as e:
-            logger.error(f"Yahoo Finance error for {ticker}: {e}")
+            logger.error("Yahoo Finance error for %s: %s", ticker, e)
         return 'N/A', 'N/A', 'neutral'
 
-    @with_most_recent_data(max_days=7)
-    def get_polygon_agg(self, ticker, date=None):
-        logger = logging.getLogger(__name__)
-        logger.debug(f"get_polygon_agg: ticker={ticker}, date={date}")
-        try:
-            aggs = self.client.get_aggs(
-                ticker=ticker,
-                multiplier=1,
-                timespan="day",
-                from_=date,
-                to=date,
-                adjusted=True
-            )
-            logger.debug(f"get_polygon_agg: aggs for {ticker} on {date}: {aggs}")
-            return aggs[0] if aggs else None
-        except Exception as e:
-            logger.error(f"get_polygon_agg: Exception for {ticker} on {date}: {e}")
-            return None
+    @_ttl_cached(3600, keep=lambda data: bool(data.get('observations')))
+    def _fred_obs(self, series_id, limit, frequency=None) -> Dict:
+        """Fetch the latest observations for a FRED series, newest first.
+
+        Slow-moving series are also cached per series for _FRED_SERIES_TTL_HOURS.
+        """
+        max_age = _FRED_SERIES_TTL_HOURS.get(series_id)
+        cache_key = f"fred_{series_id}_{limit}_{frequency or 'default'}"
+        if max_age and not self.force_refresh:
+            cached_data = self._load_from_cache(cache_key, max_age_hours=max_age)
+            if cached_data:
+                return cached_data
+        params = {**self._fred_static, 'series_id': series_id, 'limit': limit}
+        if frequency:
+            params['frequency'] = frequency
+        response = self._http.get(_FRED_URL, params=params, timeout=_HTTP_TIMEOUT)
+        data = orjson.loads(response.content)
+        if max_age and data.get('observations'):
+            self._save_to_cache(cache_key, data, ttl_seconds=max_age * 3600)
+        return data
+
+    def _get_polygon_last_two(self, ticker):
+        """Fetch the last two daily aggs for a ticker in a single request.
 
+        Returns:
+            Tuple of (current_agg, current_date, prev_agg, prev_date)
+        """
+        now = datetime.now()
+        aggs = self.client.get_aggs(
+            ticker=ticker,
+            multiplier=1,
+            timespan="day",
+            from_=(now - timedelta(days=10)).strftime('%Y-%m-%d'),
+            to=now.strftime('%Y-%m-%d'),
+            adjusted=True,
+            limit=10
+        )
+        aggs = sorted(aggs, key=lambda x: x.timestamp) if aggs else []
+        dates = [datetime.fromtimestamp(agg.timestamp / 1000).strftime('%Y-%m-%d') for agg in aggs[-2:]]
+        logger.debug("_get_polygon_last_two: %s dates %s", ticker, dates)
+        if len(aggs) >= 2:
+            return aggs[-1], dates[-1], aggs[-2], dates[-2]
+        if aggs:
+            return aggs[-1], dates[-1], None, None
+        return None, None, None, None
+
+    @_ttl_cached(300)
     def fetch_market_indices(self) -> Dict:
         """Fetch major market indices data: Polygon first, then FRED, then Yahoo Finance (rate-limited)."""
         now = datetime.now()
-        et_time = datetime.now(pytz.timezone('US/Eastern'))
+        et_time = now.astimezone(_ET)
         is_market_hours = 9 <= et_time.hour < 16
         cache_key = (f"market_indices_{now.strftime('%Y-%m-%d_%H_%M')}" if is_market_hours 
                     else f"market_indices_{now.strftime('%Y-%m-%d_%H')}")
@@ -108,41 +321,19 @@ class MarketDataFetcher(BaseFetcher):
                 ("VIX", "VIXY", "Short-term VIX futures ETF", "Volatility"),
             ]
             results = {}
-            for name, polygon_ticker, description, group in indices:
-                value, change, direction = None, None, 'neutral'
+            with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+                futures = {idx: executor.submit(self._get_polygon_last_two, idx[1]) for idx in indices}
+            for idx in indices:
+                name, polygon_ticker, description, group = idx
+                current_agg, current_date, prev_agg, prev_date = None, None, None, None
+                value, change, direction = _EMPTY_INDEX.values()
                 try:
-                    # Get the most recent valid day for current
-                    current_agg, current_date = self.get_polygon_agg(polygon_ticker)
-                    prev_agg, prev_date = None, None
-                    if current_date and current_agg:
-                        # Parse the current date as a datetime for comparison
-                        current_dt = datetime.strptime(current_date, '%Y-%m-%d')
-                        attempted_prev_dates = []
-                        for offset in range(1, 11):
-                            prev_date_dt = current_dt - timedelta(days=offset)
-                            try_date = prev_date_dt.strftime('%Y-%m-%d')
-                            agg, date = self.get_polygon_agg(polygon_ticker, date=try_date)
-                            # Check the actual date of the returned aggregation
-                            agg_date = None
-                            if agg and hasattr(agg, 'timestamp'):
-                                # Polygon returns timestamp in ms or as datetime
-                                ts = getattr(agg, 'timestamp', None)
-                                if hasattr(ts, 'strftime'):
-                                    agg_date = ts.strftime('%Y-%m-%d')
-                                elif isinstance(ts, (int, float)):
-                                    agg_date = datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%d')
-                            attempted_prev_dates.append((try_date, date, agg_date, agg.close if agg else None))
-                            # Only accept if agg_date is strictly before current_date
-                            if agg and agg_date and agg_date < current_date:
-                                prev_agg, prev_date = agg, agg_date
-                                break
-                        logger.info(f"Index: {name} | Attempted previous dates: {attempted_prev_dates}")
-                    # Logging for debugging
-                    logger.info(f"Index: {name} | Current date: {current_date}, Previous date: {prev_date}")
+                    current_agg, current_date, prev_agg, prev_date = futures[idx].result()
+                    logger.info("Index: %s | Current date: %s, Previous date: %s", name, current_date, prev_date)
                     if current_agg and prev_agg and current_date != prev_date:
                         current = current_agg.close
                         previous = prev_agg.close
-                        logger.info(f"Index: {name} | Current value: {current}, Previous value: {previous}")
+                        logger.info("Index: %s | Current value: %s, Previous value: %s", name, current, previous)
                         change_val = ((current - previous) / previous) * 100 if previous != 0 else 0
                         value = f"{current:.2f}"
                         change = f"{change_val:+.2f}%"
@@ -150,19 +341,12 @@ class MarketDataFetcher(BaseFetcher):
                     elif current_agg:
                         current = current_agg.close
                         value = f"{current:.2f}"
-                        change = 'N/A'
-                        direction = 'neutral'
-                        logger.warning(f"Index: {name} | Only one valid trading day found or duplicate dates. Change set to N/A.")
+                        logger.warning("Index: %s | Only one valid trading day found or duplicate dates. Change set to N/A.", name)
                     else:
-                        value = 'N/A'
-                        change = 'N/A'
-                        direction = 'neutral'
-                        logger.warning(f"Index: {name} | No valid trading data found.")
+                        logger.warning("Index: %s | No valid trading data found.", name)
                 except Exception as e:
-                    value = 'N/A'
-                    change = 'N/A'
-                    direction = 'neutral'
-                    logger.error(f"Index: {name} | Exception: {e}")
+                    value, change, direction = _EMPTY_INDEX.values()
+                    logger.error("Index: %s | Exception: %s", name, e)
                 if group not in results:
                     results[group] = []
                 results[group].append({
@@ -174,23 +358,13 @@ class MarketDataFetcher(BaseFetcher):
                     'date': current_date if current_agg else None,
                     'previous_date': prev_date if prev_agg else None
                 })
-            self._save_to_cache(cache_key, results)
+            self._save_to_cache(cache_key, results, ttl_seconds=300 if is_market_hours else 3600)
 
             # --- Add 10Y Treasury to indices (Rates group) using FRED ---
             try:
                 fred_api_key = self.fred_api_key
                 if fred_api_key:
-                    response = requests.get(
-                        "https://api.stlouisfed.org/fred/series/observations",
-                        params={
-                            'series_id': 'DGS10',
-                            'api_key': fred_api_key,
-                            'file_type': 'json',
-                            'sort_order': 'desc',
-                            'limit': 7
-                        }
-                    )
-                    data = response.json()
+                    data = self._fred_obs('DGS10', 7)
                     obs = [o for o in data.get('observations', []) if o['value'] != '.']
                     if len(obs) >= 2:
                         current = float(obs[0]['value'])
@@ -211,9 +385,7 @@ class MarketDataFetcher(BaseFetcher):
                     else:
                         ten_year_idx = {
                             'name': '10Y Treasury',
-                            'value': 'N/A',
-                            'change': 'N/A',
-                            'direction': 'neutral',
+                            **_EMPTY_INDEX,
                             'description': '10-Year US Treasury Yield',
                             'date': None,
                             'previous_date': None
@@ -224,16 +396,17 @@ class MarketDataFetcher(BaseFetcher):
                     results['Rates'] = [idx for idx in results['Rates'] if idx.get('name') != '10Y Treasury']
                     results['Rates'].append(ten_year_idx)
             except Exception as e:
-                logger.error(f"Error adding 10Y Treasury to indices: {e}")
+                logger.error("Error adding 10Y Treasury to indices: %s", e)
 
             return results
         except Exception as e:
-            logger.error(f"Error fetching market indices: {e}")
+            logger.error("Error fetching market indices: %s", e)
             return {}
     
     def fetch_interest_rates(self) -> Dict:
         """Fetch interest rate data"""
-        cache_key = f"interest_rates_{datetime.now().strftime('%Y-%m-%d')}"
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        cache_key = f"interest_rates_{today_str}"
         
         if not self.force_refresh:
             cached_data = self._load_from_cache(cache_key)
@@ -243,12 +416,7 @@ class MarketDataFetcher(BaseFetcher):
         try:
             if not self.fred_api_key:
                 logger.warning("FRED API key not found")
-                return {
-                    'Federal Funds Rate': 'N/A',
-                    '10-Year Treasury': 'N/A',
-                    '30-Year Fixed Mortgage': 'N/A',
-                    'Last Updated': datetime.now().strftime('%Y-%m-%d')
-                }
+                return {**_EMPTY_RATES, 'Last Updated': today_str}
             
             series = {
                 'Federal Funds Rate': 'FEDFUNDS',
@@ -257,22 +425,14 @@ class MarketDataFetcher(BaseFetcher):
             }
             
             results = {}
-            for name, series_id in series.items():
-                response = requests.get(
-                    "https://api.stlouisfed.org/fred/series/observations",
-                    params={
-                        'series_id': series_id,
-                        'api_key': self.fred_api_key,
-                        'file_type': 'json',
-                        'sort_order': 'desc',
-                        'limit': 1
-                    }
-                )
-                data = response.json()
+            with ThreadPoolExecutor(max_workers=len(series)) as executor:
+                futures = {name: executor.submit(self._fred_obs, series_id, 1) for name, series_id in series.items()}
+            for name in series:
+                obs = futures[name].result().get('observations')
                 
-                if 'observations' in data and len(data['observations']) > 0:
-                    value = data['observations'][0]['value']
-                    date = data['observations'][0]['date']
+                if obs:
+                    value = obs[0]['value']
+                    date = obs[0]['date']
                     results[name] = f"{float(value):.2f}%"
                     results['Last Updated'] = date
                 else:
@@ -282,18 +442,15 @@ class MarketDataFetcher(BaseFetcher):
             return results
             
         except Exception as e:
-            logger.error(f"Error fetching interest rates: {e}")
-            return {
-                'Federal Funds Rate': 'N/A',
-                '10-Year Treasury': 'N/A',
-                '30-Year Fixed Mortgage': 'N/A',
-                'Last Updated': datetime.now().strftime('%Y-%m-%d')
-            }
+            logger.error("Error fetching interest rates: %s", e)
+            return {**_EMPTY_RATES, 'Last Updated': today_str}
     
     def fetch_economic_indicators(self) -> Dict:
         """Fetch economic indicators"""
         # Include timezone in cache key
-        et_now = datetime.now(pytz.timezone('US/Eastern'))
+        now = datetime.now()
+        et_now = now.astimezone(_ET)
+        today_str = now.strftime('%Y-%m-%d')
         cache_key = f"economic_indicators_{et_now.strftime('%Y-%m-%d')}"
         
         if not self.force_refresh:
@@ -305,62 +462,54 @@ class MarketDataFetcher(BaseFetcher):
         try:
             if not self.fred_api_key:
                 logger.warning("FRED API key not found")
-                return {
-                    'GDP': {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'},
-                    'Inflation': {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'},
-                    'Unemployment': {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'},
-                    'Last Updated': datetime.now().strftime('%Y-%m-%d')
-                }
+                return _empty_indicators(today_str)
             
             indicators = {
                 'GDP': {
                     'series_id': 'A191RL1Q225SBEA',  # Real GDP Growth Rate (Percent Change SAAR)
-                    'transform': lambda x: f"{float(x):.1f}%",  # Already in percent
-                    'change_transform': lambda x: f"{x:.1f}%"
+                    'transform': '{:.1f}%'.format,  # Already in percent
+                    'change_transform': '{:.1f}%'.format
                 },
                 'CPI': {
                     'series_id': 'CPIAUCSL',
-                    'transform': lambda x: f"{float(x):.1f}",
-                    'change_transform': lambda x: f"{x:.1f}%"
+                    'transform': '{:.1f}'.format,
+                    'change_transform': '{:.1f}%'.format
                 },
                 'Inflation YoY': {
                     'series_id': 'CPIAUCSL',
-                    'transform': lambda x: f"{float(x):.1f}%",
-                    'change_transform': lambda x: f"{x:.1f}%",
+                    'transform': '{:.1f}%'.format,
+                    'change_transform': '{:.1f}%'.format,
                     'yoy': True  # Flag to calculate year-over-year change
                 },
                 'Unemployment': {
                     'series_id': 'UNRATE',
-                    'transform': lambda x: f"{float(x):.1f}%",
-                    'change_transform': lambda x: f"{x:.1f}%"
+                    'transform': '{:.1f}%'.format,
+                    'change_transform': '{:.1f}%'.format
                 }
             }
             
             results = {}
+            # One request per distinct (series, frequency) at the largest limit any indicator needs;
+            # CPI and Inflation YoY share CPIAUCSL and are sliced from the same response
+            requests_needed = {}
+            for name, config in indicators.items():
+                limit = 17 if config.get('yoy', False) else 5
+                if config['series_id'] == 'CPIAUCSL':
+                    limit = max(limit, _CPI_MONTHS)
+                freq = 'q' if name == 'GDP' else None  # Use quarterly frequency for GDP
+                key = (config['series_id'], freq)
+                requests_needed[key] = max(limit, requests_needed.get(key, 0))
+            with ThreadPoolExecutor(max_workers=len(requests_needed)) as executor:
+                futures = {key: executor.submit(self._fred_obs, key[0], limit, key[1]) for key, limit in requests_needed.items()}
             for name, config in indicators.items():
                 try:
-                    # For GDP, we need quarterly data
-                    limit = 17 if config.get('yoy', False) else 5
-                    freq = 'q' if name == 'GDP' else None  # Use quarterly frequency for GDP
+                    data = futures[(config['series_id'], 'q' if name == 'GDP' else None)].result()
+                    obs = (data.get('observations') or [])[:17 if config.get('yoy', False) else 5]
                     
-                    params = {
-                        'series_id': config['series_id'],
-                        'api_key': self.fred_api_key,
-                        'file_type': 'json',
-                        'sort_order': 'desc',
-                        'limit': limit
-                    }
-                    if freq:
-                        params['frequency'] = freq
-                    
-                    response = requests.get(
-                        "https://api.stlouisfed.org/fred/series/observations",
-                        params=params
-                    )
-                    data = response.json()
-                    
-                    if 'observations' in data and len(data['observations']) >= 2:
-                        observations = [float(obs['value']) for obs in data['observations'] if obs['value'] != '.']
+                    if len(obs) >= 2:
+                        iso_dates, observations = _split_observations(obs)
+                        obs_dates = [_fmt_date(d) for d in iso_dates]
+                        arr = np.asarray(observations, dtype=np.float64)
                         
                         if len(observations) >= 2:
                             if name == 'GDP':
@@ -368,11 +517,9 @@ class MarketDataFetcher(BaseFetcher):
                                 current = observations[0]
                                 previous = observations[1]
                                 
-                                logger.info(f"GDP Raw Values - Current: {current}, Previous: {previous}")
-                                
-                                # Format dates for display
-                                current_date = datetime.strptime(data['observations'][0]['date'], '%Y-%m-%d')
-                                prev_date = datetime.strptime(data['observations'][1]['date'], '%Y-%m-%d')
+                                logger.info("GDP Raw Values - Current: %s, Previous: %s", current, previous)
+                                # Change vs. the next-older quarter (the oldest compares with itself)
+                                diffs = arr - np.append(arr[1:], arr[-1])
                                 
                                 # Determine trend
                                 if abs(current - previous) < 0.1:
@@ -387,31 +534,31 @@ class MarketDataFetcher(BaseFetcher):
                                     'previous': f"{previous:.1f}%",
                                     'change_rate': f"{(current - previous):+.1f}%",
                                     'trend': trend,
-                                    'last_updated': current_date.strftime('%m/%d/%y'),
-                                    'previous_date': prev_date.strftime('%m/%d/%y'),
+                                    'last_updated': obs_dates[0],
+                                    'previous_date': obs_dates[1],
                                     'history': [
                                         {
-                                            'date': datetime.strptime(data['observations'][i]['date'], '%Y-%m-%d').strftime('%m/%d/%y'),
-                                            'value': f"{float(observations[i]):.1f}%",
-                                            'change': f"{(float(observations[i]) - float(observations[i+1 if i+1 < len(observations) else i])):+.1f}%"
+                                            'date': obs_dates[i],
+                                            'value': f"{arr[i]:.1f}%",
+                                            'change': f"{diffs[i]:+.1f}%"
                                         }
                                         for i in range(min(4, len(observations)))
                                     ]
                                 }
                                 
-                                logger.info(f"GDP Results: {results[name]}")
+                                logger.info("GDP Results: %s", results[name])
                                 
                             elif config.get('yoy', False) and len(observations) >= 13:
                                 # Calculate year-over-year change for inflation
                                 current = observations[0]
                                 year_ago = observations[12]  # 12 months ago
                                 
-                                logger.info(f"Inflation Raw Values - Current: {current}, Year Ago: {year_ago}")
-                                logger.info(f"Inflation Dates - Current: {data['observations'][0]['date']}, Year Ago: {data['observations'][12]['date']}")
+                                logger.info("Inflation Raw Values - Current: %s, Year Ago: %s", current, year_ago)
+                                logger.info("Inflation Dates - Current: %s, Year Ago: %s", iso_dates[0], iso_dates[12])
                                 
                                 # Validate values before calculation
                                 if current <= 0 or year_ago <= 0:
-                                    logger.error(f"Invalid inflation values: current={current}, year_ago={year_ago}")
+                                    logger.error("Invalid inflation values: current=%s, year_ago=%s", current, year_ago)
                                     current_yoy = 0
                                     prev_yoy = 0
                                 else:
@@ -422,28 +569,23 @@ class MarketDataFetcher(BaseFetcher):
                                 
                                 # Validate previous values
                                 if previous <= 0 or prev_year_ago <= 0:
-                                    logger.error(f"Invalid previous inflation values: previous={previous}, prev_year_ago={prev_year_ago}")
+                                    logger.error("Invalid previous inflation values: previous=%s, prev_year_ago=%s", previous, prev_year_ago)
                                     prev_yoy = 0
                                 else:
                                     prev_yoy = ((previous / prev_year_ago) - 1) * 100
                                 
-                                # Calculate historical YoY values with improved precision
-                                historical_values = []
-                                for i in range(min(12, len(observations) - 12)):  # Get up to 12 months of history
-                                    if i + 12 < len(observations):
-                                        curr = observations[i]
-                                        prev = observations[i + 12]
-                                        if curr > 0 and prev > 0:
-                                            yoy = ((curr / prev) - 1) * 100
-                                            historical_values.append({
-                                                'date': datetime.strptime(data['observations'][i]['date'], '%Y-%m-%d').strftime('%m/%d/%y'),
-                                                'value': f"{yoy:.1f}%",
-                                                'change': f"{(yoy - ((observations[i+1] / observations[i+13] if i+13 < len(observations) else prev) - 1) * 100):+.1f}%"
-                                            })
-                                
-                                # Format dates for display
-                                current_date = datetime.strptime(data['observations'][0]['date'], '%Y-%m-%d')
-                                prev_date = datetime.strptime(data['observations'][1]['date'], '%Y-%m-%d')
+                                # Calculate historical YoY values (up to 12 months) in one pass
+                                yoy = (arr[:-12] / arr[12:] - 1) * 100
+                                next_yoy = np.append(yoy[1:], (arr[-1] - 1) * 100)
+                                valid = (arr[:-12] > 0) & (arr[12:] > 0)
+                                historical_values = [
+                                    {
+                                        'date': obs_dates[i],
+                                        'value': f"{yoy[i]:.1f}%",
+                                        'change': f"{(yoy[i] - next_yoy[i]):+.1f}%"
+                                    }
+                                    for i in np.flatnonzero(valid[:12])
+                                ]
                                 
                                 # Determine trend with more granular thresholds
                                 if abs(current_yoy - prev_yoy) < 0.1:
@@ -458,12 +600,12 @@ class MarketDataFetcher(BaseFetcher):
                                     'previous': f"{prev_yoy:.1f}%",
                                     'change_rate': f"{(current_yoy - prev_yoy):+.1f}%",
                                     'trend': trend,
-                                    'last_updated': current_date.strftime('%m/%d/%y'),
-                                    'previous_date': prev_date.strftime('%m/%d/%y'),
+                                    'last_updated': obs_dates[0],
+                                    'previous_date': obs_dates[1],
                                     'history': historical_values
                                 }
                                 
-                                logger.info(f"Inflation Results: {results[name]}")
+                                logger.info("Inflation Results: %s", results[name])
                                 
                             else:
                                 current = observations[0]
@@ -472,21 +614,26 @@ class MarketDataFetcher(BaseFetcher):
                                 # Calculate rate of change
                                 change = ((current - previous) / abs(previous)) * 100 if previous != 0 else 0
                                 
+                                # Percent change vs. the next-older observation (0 for the oldest)
+                                delta = (arr[:-1] - arr[1:]) * 100
+                                pct = np.empty_like(arr)
+                                pct[:-1] = delta / np.abs(arr[1:])
+                                pct[-1] = 0.0
+                                
                                 # Get historical values
                                 historical_values = [
                                     {
-                                        'date': datetime.strptime(data['observations'][i]['date'], '%Y-%m-%d').strftime('%m/%d/%y'),
-                                        'value': config['transform'](observations[i]),
-                                        'change': config['change_transform'](((observations[i] - observations[i+1 if i+1 < len(observations) else i]) / abs(observations[i+1 if i+1 < len(observations) else i])) * 100)
+                                        'date': obs_dates[i],
+                                        'value': config['transform'](arr[i]),
+                                        'change': config['change_transform'](pct[i])
                                     }
                                     for i in range(min(4, len(observations)))
                                 ]
                                 
                                 # Determine trend based on last 4 observations
                                 if len(observations) >= 4:
-                                    changes = [((observations[i] - observations[i+1]) / observations[i+1]) * 100 
-                                             for i in range(len(observations)-1)]
-                                    avg_change = sum(changes) / len(changes)
+                                    changes = delta / arr[1:]
+                                    avg_change = changes.mean()
                                     
                                     if abs(avg_change) < 0.05:
                                         trend = 'stable'
@@ -502,58 +649,34 @@ class MarketDataFetcher(BaseFetcher):
                                     'previous': config['transform'](previous),
                                     'change_rate': config['change_transform'](change),
                                     'trend': trend,
-                                    'last_updated': datetime.strptime(data['observations'][0]['date'], '%Y-%m-%d').strftime('%m/%d/%y'),
+                                    'last_updated': obs_dates[0],
                                     'history': historical_values
                                 }
                         else:
-                            results[name] = {
-                                'value': 'N/A',
-                                'previous': 'N/A',
-                                'change_rate': 'N/A',
-                                'trend': 'neutral',
-                                'last_updated': 'N/A'
-                            }
+                            results[name] = _EMPTY_INDICATOR.copy()
                     else:
-                        results[name] = {
-                            'value': 'N/A',
-                            'previous': 'N/A',
-                            'change_rate': 'N/A',
-                            'trend': 'neutral',
-                            'last_updated': 'N/A'
-                        }
+                        results[name] = _EMPTY_INDICATOR.copy()
                     
                 except Exception as e:
-                    logger.error(f"Error fetching {name}: {e}")
-                    results[name] = {
-                        'value': 'N/A',
-                        'previous': 'N/A',
-                        'change_rate': 'N/A',
-                        'trend': 'neutral',
-                        'last_updated': 'N/A'
-                    }
+                    logger.error("Error fetching %s: %s", name, e)
+                    results[name] = _EMPTY_INDICATOR.copy()
             
-            results['Last Updated'] = datetime.now().strftime('%Y-%m-%d')
+            results['Last Updated'] = today_str
             self._save_to_cache(cache_key, results)
             return results
             
         except Exception as e:
-            logger.error(f"Error fetching economic indicators: {e}")
-            return {
-                'GDP': {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'},
-                'Inflation': {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'},
-                'Unemployment': {'value': 'N/A', 'previous': 'N/A', 'change_rate': 'N/A', 'trend': 'neutral', 'last_updated': 'N/A'},
-                'Last Updated': datetime.now().strftime('%Y-%m-%d')
-            }
+            logger.error("Error fetching economic indicators: %s", e)
+            return _empty_indicators(today_str)
     
     def fetch_economic_history(self, series_id: str, periods: int) -> Optional[Dict]:
         """Fetch economic data history from FRED."""
         try:
             # TODO: Implement FRED API call
             # For now, return mock data
-            dates = pd.date_range(end=datetime.now(), periods=periods, freq='ME')
             values = [2.1, 2.3, 2.0, 1.8, 1.9, 2.2, 2.4, 2.1, 2.0, 1.9, 2.1, 2.3]
             return {
-                'labels': [d.strftime('%Y-%m') for d in dates],
+                'labels': _month_end_labels(periods),
                 'values': values[:periods]
             }
         except Exception as e:
@@ -561,23 +684,24 @@ class MarketDataFetcher(BaseFetcher):
             return None
     
     def fetch_inflation_yoy_history(self, periods: int) -> Optional[Dict]:
-        """Fetch year-over-year inflation history."""
-        try:
-            # TODO: Implement FRED API call
-            # For now, return mock data
-            dates = pd.date_range(end=datetime.now(), periods=periods, freq='ME')
-            values = [3.1, 3.2, 3.0, 2.9, 2.8, 2.7, 2.6, 2.5, 2.4, 2.3, 2.2, 2.1]
-            return {
-                'labels': [d.strftime('%Y-%m') for d in dates],
-                'values': values[:periods]
-            }
-        except Exception as e:
-            print(f"Error fetching inflation history: {e}")
+        """Fetch year-over-year inflation history, oldest first.
+
+        Computed from the memoized CPIAUCSL response that the indicator cards and the
+        inflation chart already share, so it costs no extra FRED call.
+        """
+        data = self.get_inflation_data(periods)
+        if not data['values']:
             return None
+        return {
+            'labels': data['labels'][::-1],
+            'values': data['values'][::-1]
+        }
     
+    @_ttl_cached(60)
     def fetch_market_status(self) -> Dict:
         """Fetch current market status"""
-        cache_key = f"market_status_{datetime.now().strftime('%Y-%m-%d_%H')}"
+        now = datetime.now()
+        cache_key = f"market_status_{now.strftime('%Y-%m-%d_%H')}"
         
         if not self.force_refresh:
             cached_data = self._load_from_cache(cache_key, max_age_hours=1)
@@ -586,31 +710,12 @@ class MarketDataFetcher(BaseFetcher):
         
         try:
             # Get current time in ET
-            et_time = datetime.now(pytz.timezone('US/Eastern'))
+            et_time = now.astimezone(_ET)
             current_time = et_time.strftime('%H:%M')
+            minutes = et_time.hour * 60 + et_time.minute
             
-            # Define market hours
-            pre_market_start = '04:00'
-            market_open = '09:30'
-            market_close = '16:00'
-            after_hours_close = '20:00'
-            
-            # Determine market status
-            if current_time < pre_market_start:
-                status = 'Closed'
-                hours = 'Pre-Market Trading starts at 4:00 AM ET'
-            elif current_time < market_open:
-                status = 'Pre-Market'
-                hours = 'Regular Trading starts at 9:30 AM ET'
-            elif current_time < market_close:
-                status = 'Open'
-                hours = 'Regular Trading Hours (9:30 AM - 4:00 PM ET)'
-            elif current_time < after_hours_close:
-                status = 'After-Hours'
-                hours = 'After-Hours Trading (until 8:00 PM ET)'
-            else:
-                status = 'Closed'
-                hours = 'Market Closed - Opens at 4:00 AM ET'
+            # Determine market status (minutes since midnight ET)
+            status, hours = _SESSION_STATUS[bisect_right(_SESSION_BOUNDARIES, minutes)]
             
             result = {
                 'status': status,
@@ -619,35 +724,53 @@ class MarketDataFetcher(BaseFetcher):
                 'last_updated': et_time.strftime('%Y-%m-%d %H:%M:%S %Z')
             }
             
-            self._save_to_cache(cache_key, result)
+            self._save_to_cache(cache_key, result, ttl_seconds=3600)
             return result
             
         except Exception as e:
-            logger.error(f"Error fetching market status: {e}")
+            logger.error("Error fetching market status: %s", e)
             return {
                 'status': 'Unknown',
                 'hours': 'Status Unavailable',
-                'current_time_et': datetime.now().strftime('%H:%M'),
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'current_time_et': now.strftime('%H:%M'),
+                'last_updated': now.strftime('%Y-%m-%d %H:%M:%S')
             }
     
+    def _latest_news(self, ticker):
+        """Return the most recent Polygon news item for a ticker, or None."""
+        return next(iter(self.client.list_ticker_news(ticker, limit=1)), None)
+
     def fetch_economic_events(self) -> Dict:
         """Fetch top 5 most active tickers and their latest news as events for the dashboard."""
+        now = datetime.now()
+        et_time = now.astimezone(_ET)
+        # The most-active snapshot does not move over the weekend, so weekends share one key
+        if et_time.weekday() >= 5:
+            year, week, _ = et_time.isocalendar()
+            cache_key = f"economic_events_weekend_{year}-W{week:02d}"
+        else:
+            cache_key = f"economic_events_{et_time.strftime('%Y-%m-%d_%H')}"
+        if not self.force_refresh:
+            cached_data = self._load_from_cache(cache_key, max_age_hours=48)
+            if cached_data:
+                return cached_data
+
         logger.info("Fetching Polygon market movers and news for events section")
         events = []
         try:
             # 1. Get top 5 most active tickers using requests
-            url = f"https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/most_active?apiKey={POLYGON_API_KEY}"
-            resp = requests.get(url)
+            url = _POLYGON_SNAPSHOT_URL.format('most_active')
+            resp = self._http.get(url, timeout=_HTTP_TIMEOUT)
             resp.raise_for_status()
-            movers = resp.json().get('tickers', [])[:5]
+            movers = orjson.loads(resp.content).get('tickers', [])[:5]
             tickers = [item['ticker'] for item in movers]
 
+            # 2. Get latest news for each ticker concurrently using the client
+            with ThreadPoolExecutor(max_workers=max(len(tickers), 1)) as executor:
+                news_by_ticker = dict(zip(tickers, executor.map(self._latest_news, tickers)))
             for ticker in tickers:
-                # 2. Get latest news for each ticker using the client
-                news_items = self.client.list_ticker_news(ticker, limit=1)
-                if news_items:
-                    news = news_items[0]
+                news = news_by_ticker[ticker]
+                if news:
                     event = {
                         'time': news.published_utc[11:16] if hasattr(news, 'published_utc') else '',
                         'country': 'US',
@@ -659,9 +782,9 @@ class MarketDataFetcher(BaseFetcher):
                         'url': getattr(news, 'article_url', None)
                     }
                     events.append(event)
-                    logger.debug(f"Added event for {ticker}: {news.title}")
+                    logger.debug("Added event for %s: %s", ticker, news.title)
         except Exception as e:
-            logger.error(f"Error fetching Polygon events: {e}")
+            logger.error("Error fetching Polygon events: %s", e)
 
         if not events:
             logger.warning("No Polygon events found for today.")
@@ -669,216 +792,191 @@ class MarketDataFetcher(BaseFetcher):
 
         result = {
             'events': events,
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'last_updated': now.strftime('%Y-%m-%d %H:%M:%S'),
         }
-        logger.info(f"Returning {len(events)} Polygon events for today")
+        self._save_to_cache(cache_key, result, ttl_seconds=48 * 3600 if et_time.weekday() >= 5 else 3600)
+        logger.info("Returning %s Polygon events for today", len(events))
         return result
     
     def get_gdp_data(self, periods: int = 8) -> Dict:
         """Get GDP growth rate data from FRED."""
         try:
-            # Get GDP data from FRED
-            response = requests.get(
-                "https://api.stlouisfed.org/fred/series/observations",
-                params={
-                    'series_id': 'A191RL1Q225SBEA',  # Real GDP Growth Rate
-                    'api_key': self.fred_api_key,
-                    'file_type': 'json',
-                    'sort_order': 'desc',
-                    'limit': periods
-                }
-            )
-            data = response.json()
-            
-            if 'observations' in data and len(data['observations']) > 0:
-                dates = [datetime.strptime(obs['date'], '%Y-%m-%d') for obs in data['observations']]
-                values = [float(obs['value']) for obs in data['observations'] if obs['value'] != '.']
+            # Get GDP data from FRED (Real GDP Growth Rate)
+            data = self._fred_obs('A191RL1Q225SBEA', periods)
+            logger.debug("Raw GDP data: %s", data)
+            obs = data.get('observations')
+            if obs:
+                dates, values = _split_observations(obs)
                 
                 # Format for chart
-                data = {
-                    'labels': [f"Q{(i%4)+1} {d.year}" for i, d in enumerate(dates)],
+                return {
+                    'labels': [_yq(d) for d in dates],
                     'values': values
                 }
-                print(f"[DEBUG] Raw GDP data: {data}")
-                return data
                 
         except Exception as e:
-            print(f"ERROR - Failed to get GDP data: {e}")
+            logger.exception("Failed to get GDP data: %s", e)
         return {'labels': [], 'values': []}
     
     def get_inflation_data(self, periods: int = 8) -> Dict:
         """Get inflation rate data from FRED."""
         try:
-            # Get inflation data from FRED
-            response = requests.get(
-                "https://api.stlouisfed.org/fred/series/observations",
-                params={
-                    'series_id': 'CPIAUCSL',  # Consumer Price Index
-                    'api_key': self.fred_api_key,
-                    'file_type': 'json',
-                    'sort_order': 'desc',
-                    'limit': periods + 12  # Need extra months for YoY calculation
-                }
-            )
-            data = response.json()
-            
-            if 'observations' in data and len(data['observations']) > 0:
-                dates = [datetime.strptime(obs['date'], '%Y-%m-%d') for obs in data['observations']]
-                values = [float(obs['value']) for obs in data['observations'] if obs['value'] != '.']
+            # Get inflation data from FRED (Consumer Price Index)
+            # Need extra months for YoY calculation; at least _CPI_MONTHS to share the indicators' response
+            data = self._fred_obs('CPIAUCSL', max(periods + 12, _CPI_MONTHS))
+            logger.debug("Raw inflation data: %s", data)
+            obs = (data.get('observations') or [])[:periods + 12]
+            if obs:
+                dates, values = _split_observations(obs)
+                values = np.asarray(values, dtype=np.float64)
                 
-                # Calculate YoY change
-                yoy_values = []
-                for i in range(len(values)):
-                    if i + 12 < len(values):  # Need 12 months of data for YoY
-                        yoy = ((values[i] - values[i + 12]) / values[i + 12]) * 100
-                        yoy_values.append(yoy)
+                # Calculate YoY change (needs 12 months of data per point)
+                yoy_values = ((values[:-12] - values[12:]) / values[12:] * 100).tolist()
                 
                 # Format for chart
-                data = {
-                    'labels': [d.strftime('%Y-%m') for d in dates[:len(yoy_values)]],
+                return {
+                    'labels': [_ym(d) for d in dates[:len(yoy_values)]],
                     'values': yoy_values
                 }
-                print(f"[DEBUG] Raw inflation data: {data}")
-                return data
                 
         except Exception as e:
-            print(f"ERROR - Failed to get inflation data: {e}")
+            logger.exception("Failed to get inflation data: %s", e)
         return {'labels': [], 'values': []}
     
     def get_unemployment_data(self, periods: int = 8) -> Dict:
         """Get unemployment rate data from FRED."""
         try:
-            # Get unemployment data from FRED
-            response = requests.get(
-                "https://api.stlouisfed.org/fred/series/observations",
-                params={
-                    'series_id': 'UNRATE',  # Unemployment Rate
-                    'api_key': self.fred_api_key,
-                    'file_type': 'json',
-                    'sort_order': 'desc',
-                    'limit': periods
-                }
-            )
-            data = response.json()
-            
-            if 'observations' in data and len(data['observations']) > 0:
-                dates = [datetime.strptime(obs['date'], '%Y-%m-%d') for obs in data['observations']]
-                values = [float(obs['value']) for obs in data['observations'] if obs['value'] != '.']
+            # Get unemployment data from FRED (Unemployment Rate)
+            data = self._fred_obs('UNRATE', periods)
+            logger.debug("Raw unemployment data: %s", data)
+            obs = data.get('observations')
+            if obs:
+                dates, values = _split_observations(obs)
                 
                 # Format for chart
-                data = {
-                    'labels': [d.strftime('%Y-%m') for d in dates],
+                return {
+                    'labels': [_ym(d) for d in dates],
                     'values': values
                 }
-                print(f"[DEBUG] Raw unemployment data: {data}")
-                return data
                 
         except Exception as e:
-            print(f"ERROR - Failed to get unemployment data: {e}")
+            logger.exception("Failed to get unemployment data: %s", e)
         return {'labels': [], 'values': []}
     
+    @_ttl_cached(3600, keep=lambda data: bool(data['labels']))
     def get_bond_data(self, periods: int = 24, frequency: str = 'monthly') -> Dict:
-        """Get bond yield data from FRED, with debugging and frequency control."""
+        """Get bond yield data from FRED, with debugging and frequency control.
+
+        DGS10 and DGS2 come back joined on date from a single fredgraph CSV request and are
+        averaged per month (or year) here, matching the FRED API's default 'avg' aggregation.
+        """
         try:
-            # Set FRED frequency
-            freq_map = {'monthly': 'm', 'yearly': 'a'}
-            freq_param = freq_map.get(frequency, 'm')
-            print(f"[DEBUG] Fetching bond data: periods={periods}, frequency={frequency}, freq_param={freq_param}")
-            # Get 10Y Treasury yield
-            params_10y = {
-                'series_id': 'DGS10',
-                'api_key': self.fred_api_key,
-                'file_type': 'json',
-                'sort_order': 'desc',
-                'limit': periods,
-                'frequency': freq_param
-            }
-            response_10y = requests.get(
-                "https://api.stlouisfed.org/fred/series/observations",
-                params=params_10y
-            )
-            data_10y = response_10y.json()
-            # Get 2Y Treasury yield
-            params_2y = {
-                'series_id': 'DGS2',
-                'api_key': self.fred_api_key,
-                'file_type': 'json',
-                'sort_order': 'desc',
-                'limit': periods,
-                'frequency': freq_param
-            }
-            response_2y = requests.get(
-                "https://api.stlouisfed.org/fred/series/observations",
-                params=params_2y
-            )
-            data_2y = response_2y.json()
-            if ('observations' in data_10y and len(data_10y['observations']) > 0 and
-                'observations' in data_2y and len(data_2y['observations']) > 0):
-                dates = [datetime.strptime(obs['date'], '%Y-%m-%d') for obs in data_10y['observations']]
-                values_10y = [float(obs['value']) for obs in data_10y['observations'] if obs['value'] != '.']
-                values_2y = [float(obs['value']) for obs in data_2y['observations'] if obs['value'] != '.']
-                print(f"[DEBUG] 10Y count: {len(values_10y)}, 2Y count: {len(values_2y)}")
-                print(f"[DEBUG] 10Y dates: {dates}")
-                print(f"[DEBUG] 10Y values: {values_10y}")
-                print(f"[DEBUG] 2Y values: {values_2y}")
+            yearly = frequency == 'yearly'
+            logger.debug("Fetching bond data: periods=%s, frequency=%s", periods, frequency)
+            today = datetime.now()
+            if yearly:
+                start = f"{today.year - periods + 1}-01-01"
+            else:
+                start_month = today.year * 12 + today.month - periods
+                start = f"{start_month // 12:04d}-{start_month % 12 + 1:02d}-01"
+            response = self._http.get(_FREDGRAPH_CSV_URL, params={'id': 'DGS10,DGS2', 'cosd': start}, timeout=_HTTP_TIMEOUT)
+            response.raise_for_status()
+            # Accumulate [sum_10y, count_10y, sum_2y, count_2y] per period; rows arrive oldest first
+            buckets = {}
+            rows = csv.reader(io.StringIO(response.text))
+            next(rows, None)  # header
+            for row in rows:
+                if len(row) < 3:
+                    continue
+                acc = buckets.setdefault(row[0][:4] if yearly else row[0][:7], [0.0, 0, 0.0, 0])
+                for col, slot in ((1, 0), (2, 2)):
+                    if row[col] not in ('', '.'):
+                        acc[slot] += float(row[col])
+                        acc[slot + 1] += 1
+            # Keep only periods with both yields (e.g. a new month whose only row is a holiday '.'
+            # has neither), so the labels and the two series stay aligned
+            labels = [k for k in reversed(buckets) if buckets[k][1] and buckets[k][3]][:periods]
+            if labels:
+                values_10y = [round(buckets[k][0] / buckets[k][1], 2) for k in labels]
+                values_2y = [round(buckets[k][2] / buckets[k][3], 2) for k in labels]
+                logger.debug("10Y count: %d, 2Y count: %d", len(values_10y), len(values_2y))
+                logger.debug("10Y values: %s", values_10y)
+                logger.debug("2Y values: %s", values_2y)
                 # Format for chart
                 data = {
-                    'labels': [d.strftime('%Y') if frequency == 'yearly' else d.strftime('%Y-%m') for d in dates],
+                    'labels': labels,
                     'values': values_10y,
                     'values_2y': values_2y
                 }
-                print(f"[DEBUG] Final bond chart labels: {data['labels']}")
+                logger.debug("Final bond chart labels: %s", data['labels'])
                 return data
         except Exception as e:
-            print(f"ERROR - Failed to get bond data: {e}")
+            logger.exception("Failed to get bond data: %s", e)
         return {'labels': [], 'values': [], 'values_2y': []}
     
-    def fetch_top_movers_and_news(self, limit: int = 5) -> list:
-        """Fetch top market movers and their latest news from Polygon."""
-        movers = []
+    def _polygon_snapshot(self, direction: str) -> Dict:
+        """Fetch a Polygon stock snapshot list ('most_active', 'gainers' or 'losers')."""
+        resp = self._http.get(_POLYGON_SNAPSHOT_URL.format(direction), timeout=_HTTP_TIMEOUT)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    @staticmethod
+    def _news_item_fields(news: Dict) -> Dict:
+        """Headline, URL and publish time of a Polygon news result."""
+        return {
+            'headline': news.get('title', ''),
+            'url': news.get('article_url', ''),
+            'published_utc': news.get('published_utc', '')
+        }
+
+    def _news_fields(self, ticker) -> Dict:
+        """Headline, URL and publish time of a ticker's latest Polygon news item (blank on failure)."""
         try:
-            url = f"https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/most_active?apiKey={POLYGON_API_KEY}"
-            resp = requests.get(url)
+            news_url = _POLYGON_NEWS_URL.format(ticker)
+            news_resp = self._http.get(news_url, timeout=_HTTP_TIMEOUT)
+            results = orjson.loads(news_resp.content).get('results')
+            if results:
+                return self._news_item_fields(results[0])
+        except Exception as e:
+            logger.error("Error fetching news for %s: %s", ticker, e)
+        return {'headline': '', 'url': '', 'published_utc': ''}
+
+    def _news_for(self, tickers) -> list:
+        """News fields for each ticker, returned in ticker order.
+
+        One ticker.any_of request covers all tickers; any ticker without an
+        article in that page falls back to its own lookup.
+        """
+        if not tickers:
+            return []
+        latest = {}
+        try:
+            url = _POLYGON_BATCH_NEWS_URL.format(','.join(tickers), min(len(tickers) * _NEWS_PER_TICKER, 1000))
+            resp = self._http.get(url, timeout=_HTTP_TIMEOUT)
             resp.raise_for_status()
-            data = resp.json()
-            tickers = data.get('tickers', [])[:limit]
-            for item in tickers:
-                ticker = item.get('ticker')
-                name = item.get('name', ticker)
-                # Fetch latest news for this ticker
-                news_url = f"https://api.polygon.io/v2/reference/news?ticker={ticker}&limit=1&apiKey={POLYGON_API_KEY}"
-                news_resp = requests.get(news_url)
-                news_data = news_resp.json()
-                if news_data.get('results'):
-                    news = news_data['results'][0]
-                    headline = news.get('title', '')
-                    url = news.get('article_url', '')
-                    published_utc = news.get('published_utc', '')
-                else:
-                    headline = ''
-                    url = ''
-                    published_utc = ''
-                movers.append({
-                    'ticker': ticker,
-                    'name': name,
-                    'headline': headline,
-                    'url': url,
-                    'published_utc': published_utc
-                })
+            wanted = set(tickers)
+            # Results are newest first, so the first article seen per ticker is its latest
+            for news in orjson.loads(resp.content).get('results') or []:
+                for ticker in news.get('tickers') or []:
+                    if ticker in wanted and ticker not in latest:
+                        latest[ticker] = self._news_item_fields(news)
         except Exception as e:
-            print(f"Error fetching top movers and news: {e}")
-        return movers
-    
+            logger.error("Error fetching batched news for %s: %s", tickers, e)
+        missing = [t for t in tickers if t not in latest]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                latest.update(zip(missing, executor.map(self._news_fields, missing)))
+        return [latest[t] for t in tickers]
+
+    @_ttl_cached(30)
     def fetch_todays_events(self, limit=5):
         movers = []
         seen = set()
         try:
-            # Get top gainers and losers
-            for direction in ['gainers', 'losers']:
-                url = f"https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/{direction}?apiKey={POLYGON_API_KEY}"
-                resp = requests.get(url)
-                resp.raise_for_status()
-                data = resp.json()
+            # Get top gainers and losers (both snapshots in flight together)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                snapshots = list(executor.map(self._polygon_snapshot, ['gainers', 'losers']))
+            for data in snapshots:
                 for item in data.get('tickers', []):
                     ticker = item.get('ticker')
                     if ticker and ticker not in seen:
@@ -890,22 +988,11 @@ class MarketDataFetcher(BaseFetcher):
                         })
             # Sort by absolute % change, descending
             movers = sorted(movers, key=lambda x: abs(x['change']), reverse=True)[:limit]
-            # Fetch news for each
-            for mover in movers:
-                news_url = f"https://api.polygon.io/v2/reference/news?ticker={mover['ticker']}&limit=1&apiKey={POLYGON_API_KEY}"
-                news_resp = requests.get(news_url)
-                news_data = news_resp.json()
-                if news_data.get('results'):
-                    news = news_data['results'][0]
-                    mover['headline'] = news.get('title', '')
-                    mover['url'] = news.get('article_url', '')
-                    mover['published_utc'] = news.get('published_utc', '')
-                else:
-                    mover['headline'] = ''
-                    mover['url'] = ''
-                    mover['published_utc'] = ''
+            # Fetch news for each concurrently
+            for mover, news_fields in zip(movers, self._news_for([m['ticker'] for m in movers])):
+                mover.update(news_fields)
         except Exception as e:
-            print(f"Error fetching today's events: {e}")
+            logger.exception("Error fetching today's events: %s", e)
         return movers
     
     def fetch_index_history(self, ticker: str, periods: int = 60, interval: str = 'day') -> Optional[Dict]:
@@ -922,13 +1009,14 @@ class MarketDataFetcher(BaseFetcher):
                 to=end_date.strftime('%Y-%m-%d'),
                 adjusted=True
             )
-            logger.debug(f"Polygon aggs type: {type(aggs)}; length: {len(aggs) if hasattr(aggs, '__len__') else 'N/A'}")
+            logger.debug("Polygon aggs type: %s; length: %s", type(aggs), len(aggs) if hasattr(aggs, '__len__') else 'N/A')
             if aggs and len(aggs) > 0:
-                logger.debug(f"First agg: {aggs[0]}")
-                logger.debug(f"First agg.timestamp type: {type(getattr(aggs[0], 'timestamp', None))}")
-                for i, agg in enumerate(aggs[:3]):
-                    logger.debug(f"Agg {i}: {agg}")
-                    logger.debug(f"Agg {i} timestamp: {getattr(agg, 'timestamp', None)} type: {type(getattr(agg, 'timestamp', None))}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("First agg: %s", aggs[0])
+                    logger.debug("First agg.timestamp type: %s", type(getattr(aggs[0], 'timestamp', None)))
+                    for i, agg in enumerate(aggs[:3]):
+                        logger.debug("Agg %s: %s", i, agg)
+                        logger.debug("Agg %s timestamp: %s type: %s", i, getattr(agg, 'timestamp', None), type(getattr(agg, 'timestamp', None)))
                 aggs = aggs[-periods:]  # Only keep the most recent 'periods' data points
                 labels = []
                 for agg in aggs:
@@ -946,13 +1034,13 @@ class MarketDataFetcher(BaseFetcher):
                     'low': [agg.low for agg in aggs],
                     'close': [agg.close for agg in aggs],
                 }
-                logger.info(f"Fetched {len(values)} data points for {ticker} from Polygon.")
+                logger.info("Fetched %s data points for %s from Polygon.", len(values), ticker)
                 return {'labels': labels, 'values': values, 'ohlc': ohlc}
             else:
-                logger.warning(f"No historical data returned for {ticker} from Polygon.")
+                logger.warning("No historical data returned for %s from Polygon.", ticker)
                 return {'labels': [], 'values': []}
         except Exception as e:
-            logger.error(f"Error fetching index history for {ticker} from Polygon: {e}")
+            logger.error("Error fetching index history for %s from Polygon: %s", ticker, e)
             return {'labels': [], 'values': []}
     
     def fetch_style_box_etf_data(self) -> Dict:
@@ -993,7 +1081,32 @@ class MarketDataFetcher(BaseFetcher):
                     else:
                         z_row.append(None)
                 except Exception as e:
-                    logger.error(f"[StyleBox] Ticker: {ticker} | Exception: {e}")
+                    logger.error("[StyleBox] Ticker: %s | Exception: %s", ticker, e)
                     z_row.append(None)
             z.append(z_row)
-        return {"z": z, "x": x_labels, "y": y_labels} 
\ No newline at end of file
+        return {"z": z, "x": x_labels, "y": y_labels} 
+
+    def fetch_index_histories(self, tickers: Dict[str, str], periods: int = 60) -> Dict:
+        """Fetch OHLC histories for several tickers concurrently, keyed by display name."""
+        if not tickers:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+            futures = {name: executor.submit(self.fetch_index_history, ticker, periods) for name, ticker in tickers.items()}
+        return {name: futures[name].result() for name in tickers}
+
+    def fetch_all(self) -> Dict:
+        """Run the independent report fetches concurrently and return their results by key."""
+        jobs = {
+            'interest_rates': self.fetch_interest_rates,
+            'indices': self.fetch_market_indices,
+            'economic_indicators': self.fetch_economic_indicators,
+            'gdp': self.get_gdp_data,
+            'inflation': self.get_inflation_data,
+            'unemployment': self.get_unemployment_data,
+            'bond': self.get_bond_data,
+            'style_box': self.fetch_style_box_etf_data,
+            'todays_events': self.fetch_todays_events,
+        }
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {key: executor.submit(fn) for key, fn in jobs.items()}
+        return {key: futures[key].result() for key in jobs}
@@ -1,7 +1,9 @@
 import os
 from datetime import datetime
 import logging
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader
 from workflows.metadata_generator import generate_metadata, save_metadata
 from workflows.market.market_chart_generator import (
@@ -10,85 +12,154 @@ from workflows.market.market_chart_generator import (
     generate_unemployment_chart,
     generate_bond_chart,
     generate_market_index_chart,
-    generate_style_box_heatmap
+    generate_style_box_heatmap,
+    ensure_charts_dir,
+    PLOTLYJS_CDN_URL
 )
-from typing import Dict
+from typing import Dict, Literal
 from workflows.market.market_data import MarketDataFetcher
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Define CustomEncoder class at module level
-class CustomEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if callable(obj):
-            return str(obj)
-        try:
-            return json.JSONEncoder.default(self, obj)
-        except TypeError:
-            return str(obj)
-
-def generate_market_report(data: dict, report_dir: str, force_refresh: bool = False) -> str:
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Index display names mapped to the ETF tickers their history charts are drawn from
+INDEX_TICKERS = {
+    'S&P 500': 'SPY',
+    'Dow Jones': 'DIA',
+    'Nasdaq-100': 'QQQ',
+    'S&P 400 MidCap': 'MDY',
+    'Russell 2000': 'IWM',
+    'S&P 500 Growth': 'IVW',
+    'S&P 500 Value': 'IVE',
+    'Dollar Index': 'UUP',
+    'Oil (WTI)': 'USO',
+    'VIX': 'VIXY',
+}
+
+# Sentiment card keys and the index each one reads
+_SENTIMENT_LABELS = (
+    ('dxy', 'Dollar Index'),
+    ('oil', 'Oil (WTI)'),
+    ('spy', 'S&P 500'),
+    ('vix', 'VIX'),
+    ('ten_year', '10Y Treasury'),
+)
+
+# Rates rows already shown by their own yield charts, left out of the indices table
+_CHARTED_RATES = frozenset({'10Y Treasury', '2Y Treasury'})
+
+
+def _json_default(obj):
+    """orjson fallback for values it cannot serialise natively: dump them as their str()."""
+    return str(obj)
+
+
+def _dumps(obj) -> bytes:
+    """Serialise obj to compact JSON with orjson, stringifying anything it does not support."""
+    return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS)
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """Write an already encoded payload straight to a file descriptor, normally in a single os.write call."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _template_env() -> Environment:
+    """Jinja environment shared by every report render, so templates compile once per process."""
+    template_dirs = [
+        os.path.dirname(__file__),  # current dir
+        os.path.dirname(os.path.dirname(__file__)),  # parent dir
+    ]
+    env = Environment(loader=FileSystemLoader(template_dirs), auto_reload=False, cache_size=-1)
+    # Add custom filter for JSON serialization
+    env.filters['safe_tojson'] = lambda obj: _dumps(obj).decode()
+    return env
+
+
+def _report_metadata(report_dir: str, now: datetime) -> dict:
+    """Build the metadata that lists a finished market report on the dashboard."""
+    current_date = now.strftime('%Y-%m-%d')
+    return generate_metadata(
+        symbol="MARKET",
+        timeframe="snapshot",
+        start_date=current_date,
+        end_date=current_date,
+        initial_capital=0,
+        commission=0,
+        report_type="market",
+        directory_name=os.path.basename(report_dir),
+        additional_data={
+            "status": "finished",
+            "title": "Daily Market Check",
+            "created": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "report_type": "snapshot"
+        }
+    )
+
+
+def generate_market_report(data: dict, report_dir: str, force_refresh: bool = False,
+                           embed_mode: Literal['standalone', 'fragment'] = 'standalone') -> str:
     """Generate market analysis report
     
     Args:
         data (dict): Market data dictionary containing indices, rates, etc.
         report_dir (str): Directory to save the report
         force_refresh (bool): Whether to force refresh cached data
+        embed_mode (str): 'standalone' embeds each economic chart through an iframe; 'fragment' inlines
+            the chart fragments into the report and loads plotly.js once
         
     Returns:
         str: Path to generated report
     """
     try:
         logger.info("Starting market report generation")
+        now = datetime.now()  # one timestamp for the whole report
         logger.info(f"Received data keys: {data.keys()}")
         
-        # Create output directory if it doesn't exist
-        os.makedirs(report_dir, exist_ok=True)
-        
-        # Get the templates directory relative to this file
-        template_dirs = [
-            os.path.dirname(__file__),  # current dir
-            os.path.dirname(os.path.dirname(__file__)),  # parent dir
-        ]
-        env = Environment(loader=FileSystemLoader(template_dirs))
-        
-        # Add custom filter for JSON serialization
-        env.filters['safe_tojson'] = lambda obj: json.dumps(obj, cls=CustomEncoder)
+        # Create the output directory and its charts/ subdirectory once for the whole report
+        ensure_charts_dir(report_dir)
         
-        # --- Fetch top movers and news ---
+        # --- Start fetching today's events and the style box, unless the caller supplied them ---
         fetcher = MarketDataFetcher()
-        market_movers = fetcher.fetch_top_movers_and_news()
+        fetch_jobs = {}
+        if data.get('todays_events') is None:
+            fetch_jobs['todays_events'] = fetcher.fetch_todays_events
+        if not data.get('style_box_heatmap_path'):
+            fetch_jobs['style_box'] = fetcher.fetch_style_box_etf_data
+        pending = {}
+        if fetch_jobs:
+            # Left running in the background; each result is collected where it is first needed
+            executor = ThreadPoolExecutor(max_workers=len(fetch_jobs))
+            pending = {key: executor.submit(func) for key, func in fetch_jobs.items()}
+            executor.shutdown(wait=False)
 
-        # --- Fetch today's events (top movers + news) ---
-        todays_events = fetcher.fetch_todays_events()
-
-        # --- Extract VIX value from indices ---
-        vix_value = None
+        # --- Extract Market Sentiment Data ---
         indices = data.get('indices', {})
+        # One pass over every group: index entries by name (first one seen wins) and the tickers to chart
+        indices_by_name = {}
+        wanted_tickers = {}
         for group in indices.values():
             for idx in group:
-                if idx.get('name') == 'VIX':
-                    vix_value = idx.get('value')
-
-        # --- Extract Market Sentiment Data ---
+                name = idx.get('name')
+                if name in indices_by_name:
+                    continue
+                indices_by_name[name] = idx
+                ticker = INDEX_TICKERS.get(name)
+                if ticker:
+                    wanted_tickers[name] = ticker
         sentiment_data = {}
-        # Helper to find by name in all groups
-        def find_index(name):
-            for group in indices.values():
-                for idx in group:
-                    if idx.get('name') == name:
-                        return idx
-            return None
-        for key, label in [
-            ('dxy', 'Dollar Index'),
-            ('oil', 'Oil (WTI)'),
-            ('spy', 'S&P 500'),
-            ('vix', 'VIX'),
-            ('ten_year', '10Y Treasury'),
-        ]:
-            idx = find_index(label)
+        for key, label in _SENTIMENT_LABELS:
+            idx = indices_by_name.get(label)
             if idx:
                 sentiment_data[key] = {
                     'name': label,
@@ -98,60 +169,55 @@ def generate_market_report(data: dict, report_dir: str, force_refresh: bool = Fa
                 }
 
         # --- Generate market index charts ---
-        market_index_charts = {}
-        # Map display names to tickers
-        index_tickers = {
-            'S&P 500': 'SPY',
-            'Dow Jones': 'DIA',
-            'Nasdaq-100': 'QQQ',
-            'S&P 400 MidCap': 'MDY',
-            'Russell 2000': 'IWM',
-            'S&P 500 Growth': 'IVW',
-            'S&P 500 Value': 'IVE',
-            'Dollar Index': 'UUP',
-            'Oil (WTI)': 'USO',
-            'VIX': 'VIXY',
-        }
-        for group, group_indices in indices.items():
-            for idx in group_indices:
-                name = idx.get('name')
-                ticker = index_tickers.get(name)
-                if ticker:
-                    hist_data = fetcher.fetch_index_history(ticker, periods=60)
-                    chart_path = generate_market_index_chart(hist_data, report_dir, name)
-                    market_index_charts[name] = chart_path
+        def index_chart(name):
+            hist_data = fetcher.fetch_index_history(wanted_tickers[name], periods=60)
+            return generate_market_index_chart(hist_data, report_dir, name)
+
+        # Reuse the charts the caller already drew; fetch and draw the rest concurrently
+        drawn = data.get('market_index_charts') or {}
+        missing = [name for name in wanted_tickers if not drawn.get(name)]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                drawn = {**drawn, **dict(zip(missing, executor.map(index_chart, missing)))}
+        market_index_charts = {name: drawn[name] for name in wanted_tickers}
 
-        # Remove 10Y and 2Y Treasury from the 'Rates' group in indices to avoid duplicate rendering
+        # Drop 10Y and 2Y Treasury from the 'Rates' group to avoid duplicate rendering, in a copy so the
+        # caller's data (and raw_data.json) keeps every row
         if 'Rates' in indices:
-            indices['Rates'] = [idx for idx in indices['Rates'] if idx.get('name') not in ['10Y Treasury', '2Y Treasury']]
+            indices = {**indices, 'Rates': [idx for idx in indices['Rates'] if idx.get('name') not in _CHARTED_RATES]}
 
         # --- Use style box heatmap path from data if present, else generate ---
         style_box_heatmap_path = data.get('style_box_heatmap_path')
-        if not style_box_heatmap_path:
-            style_box_data = fetcher.fetch_style_box_etf_data()
+        if 'style_box' in pending:
+            style_box_data = pending['style_box'].result()
             if style_box_data and style_box_data.get('z'):
                 style_box_heatmap_path = generate_style_box_heatmap(style_box_data, report_dir)
 
+        # Bind each history once; the template context and the chart jobs share the same objects
+        gdp_history = data.get('gdp_history') or {}
+        inflation_history = data.get('inflation_history') or {}
+        unemployment_history = data.get('unemployment_history') or {}
+        bond_history = data.get('bond_history') or {}
+
+        # --- Today's events (top movers + news) ---
+        todays_events = pending['todays_events'].result() if 'todays_events' in pending else data['todays_events']
+
         # Prepare template data
         template_data = {
-            'date': datetime.now().strftime('%B %d, %Y'),
-            'generated_at': datetime.now().strftime('%I:%M %p'),
+            'date': now.strftime('%B %d, %Y'),
+            'generated_at': now.strftime('%I:%M %p'),
             'market_status': data.get('market_status', {
                 'status': 'Unknown',
                 'hours': 'Status Unavailable'
             }),
-            'economic_events': data.get('economic_events', {}).get('events', []),
+            'economic_events': (data.get('economic_events') or {}).get('events', []),
             'indices': indices,
             'interest_rates': data.get('interest_rates', {}),
             'economic_indicators': data.get('economic_indicators', {}),
-            'gdp_history': data.get('gdp_history', {}),
-            'inflation_history': data.get('inflation_history', {}),
-            'unemployment_history': data.get('unemployment_history', {}),
-            'bond_history': data.get('bond_history', {}),
-            'gdp_data': data.get('gdp_history', {}),
-            'inflation_data': data.get('inflation_history', {}),
-            'unemployment_data': data.get('unemployment_history', {}),
-            'bond_data': data.get('bond_history', {}),
+            'gdp_history': gdp_history,
+            'inflation_history': inflation_history,
+            'unemployment_history': unemployment_history,
+            'bond_history': bond_history,
             'todays_events': todays_events,
             'sentiment_data': sentiment_data,
             'vix_value': sentiment_data.get('vix', {}).get('value'),
@@ -161,52 +227,48 @@ def generate_market_report(data: dict, report_dir: str, force_refresh: bool = Fa
             'style_box_heatmap_path': style_box_heatmap_path,
         }
         
-        # Generate charts if data is available
-        if 'gdp_history' in data and data['gdp_history'].get('values'):
-            template_data['gdp_chart_path'] = generate_gdp_chart(data['gdp_history'], report_dir)
-            
-        if 'inflation_history' in data and data['inflation_history'].get('values'):
-            template_data['inflation_chart_path'] = generate_inflation_chart(data['inflation_history'], report_dir)
-            
-        if 'unemployment_history' in data and data['unemployment_history'].get('values'):
-            template_data['unemployment_chart_path'] = generate_unemployment_chart(data['unemployment_history'], report_dir)
-            
-        if 'bond_history' in data and data['bond_history'].get('values'):
-            template_data['bond_chart_path'] = generate_bond_chart(data['bond_history'], report_dir)
+        # Generate charts if data is available; they are independent, so render them concurrently
+        chart_jobs = {
+            f'{kind}_chart_path': (func, history)
+            for kind, func, history in (('gdp', generate_gdp_chart, gdp_history),
+                                        ('inflation', generate_inflation_chart, inflation_history),
+                                        ('unemployment', generate_unemployment_chart, unemployment_history),
+                                        ('bond', generate_bond_chart, bond_history))
+            if history.get('values')
+        }
+        if chart_jobs:
+            with ThreadPoolExecutor(max_workers=len(chart_jobs)) as executor:
+                futures = {key: executor.submit(func, chart_data, report_dir, embed_mode=embed_mode)
+                           for key, (func, chart_data) in chart_jobs.items()}
+            for key, future in futures.items():
+                template_data[key] = future.result()
+
+        # Inline the chart fragments so the report loads plotly.js once instead of once per iframe
+        template_data['chart_fragments'] = {}
+        if embed_mode == 'fragment':
+            for kind in ('gdp', 'inflation', 'unemployment', 'bond'):
+                chart_path = template_data.get(f'{kind}_chart_path')
+                if chart_path:
+                    with open(os.path.join(report_dir, chart_path), encoding='utf-8') as f:
+                        template_data['chart_fragments'][kind] = f.read()
+            template_data['plotlyjs_url'] = PLOTLYJS_CDN_URL
         
-        # Load and render the template (use market_report.html)
-        template = env.get_template('market_report.html')
-        report_html = template.render(**template_data)
+        # Load the template (use market_report.html) and stream it to disk in chunks instead of one big string
+        template = _template_env().get_template('market_report.html')
+        report_stream = template.stream(**template_data)
+        report_stream.enable_buffering(size=64)
         
-        # Save the report
+        # Render and save the report in the background while the raw data is serialized and saved
         report_path = os.path.join(report_dir, "index.html")
-        with open(report_path, 'w') as f:
-            f.write(report_html)
-        
-        # Save raw data
         raw_data_path = os.path.join(report_dir, 'raw_data.json')
-        with open(raw_data_path, 'w') as f:
-            json.dump(data, f, indent=2, cls=CustomEncoder)
-            
-        # Generate and save metadata
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        metadata = generate_metadata(
-            symbol="MARKET",
-            timeframe="snapshot",
-            start_date=current_date,
-            end_date=current_date,
-            initial_capital=0,
-            commission=0,
-            report_type="market",
-            directory_name=os.path.basename(report_dir),
-            additional_data={
-                "status": "finished",
-                "title": "Daily Market Check",
-                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "report_type": "snapshot"
-            }
-        )
-        save_metadata(metadata, report_dir)
+        # Metadata is built alongside the writes but only saved once the HTML is on disk, so a failed
+        # render never leaves a "finished" report on the dashboard
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            report_write = executor.submit(report_stream.dump, report_path, encoding='utf-8')
+            metadata = executor.submit(_report_metadata, report_dir, now)
+            _write_bytes(raw_data_path, _dumps(data))
+            report_write.result()
+            save_metadata(metadata.result(), report_dir)
             
         logger.info(f"Report generated at: {report_path}")
         return report_path